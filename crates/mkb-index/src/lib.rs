@@ -10,7 +10,7 @@
 use std::path::Path;
 
 use rusqlite::ffi::sqlite3_auto_extension;
-use rusqlite::{params, types::Value as SqlValue, Connection};
+use rusqlite::{params, types::Value as SqlValue, Connection, OptionalExtension};
 use sqlite_vec::sqlite3_vec_init;
 use zerocopy::IntoBytes;
 
@@ -20,6 +20,28 @@ use mkb_core::error::MkbError;
 /// Embedding dimension for text-embedding-3-small (OpenAI).
 pub const EMBEDDING_DIM: usize = 1536;
 
+/// Environment variable that, set to `1`, opens index databases with an
+/// in-memory journal and no syncs. Crash-unsafe; meant for test suites.
+pub const TEST_IN_MEMORY_ENV: &str = "MKB_TEST_IN_MEMORY";
+
+/// Element type of the vec0 search column. Vectors are int8-quantized
+/// with a per-vector scale; cosine distance is invariant to that scale,
+/// so only the quantized components are stored in the search index.
+const VEC_COLUMN_TYPE: &str = "int8";
+
+/// Quantize an embedding to int8, scaling its largest component to ±127.
+fn quantize_int8(embedding: &[f32]) -> Vec<i8> {
+    let max_abs = embedding.iter().fold(0.0f32, |m, v| m.max(v.abs()));
+    if max_abs == 0.0 {
+        return vec![0; embedding.len()];
+    }
+    let scale = 127.0 / max_abs;
+    embedding
+        .iter()
+        .map(|v| (v * scale).round() as i8)
+        .collect()
+}
+
 /// Register sqlite-vec extension globally. Safe to call multiple times.
 fn ensure_vec_extension() {
     use std::sync::Once;
@@ -38,12 +60,30 @@ pub struct IndexManager {
 impl IndexManager {
     /// Open or create an index database at the given path.
     ///
+    /// The database runs in WAL mode with `synchronous=NORMAL`, so a commit
+    /// appends to the log without an fsync; the log is synced at
+    /// checkpoints. The index can be rebuilt from the vault, so losing the
+    /// last commits on power failure is acceptable.
+    ///
+    /// When [`TEST_IN_MEMORY_ENV`] is set to `1`, the journal is kept in
+    /// memory and nothing is synced instead, for throwaway test vaults.
+    ///
     /// # Errors
     ///
     /// Returns [`MkbError::Index`] if the database cannot be opened.
     pub fn open(path: &Path) -> Result<Self, MkbError> {
         ensure_vec_extension();
         let conn = Connection::open(path).map_err(|e| MkbError::Index(e.to_string()))?;
+        let (journal_mode, synchronous) =
+            if std::env::var(TEST_IN_MEMORY_ENV).is_ok_and(|v| v == "1") {
+                ("MEMORY", "OFF")
+            } else {
+                ("WAL", "NORMAL")
+            };
+        conn.pragma_update(None, "journal_mode", journal_mode)
+            .map_err(|e| MkbError::Index(e.to_string()))?;
+        conn.pragma_update(None, "synchronous", synchronous)
+            .map_err(|e| MkbError::Index(e.to_string()))?;
         let mgr = Self { conn };
         mgr.create_schema()?;
         Ok(mgr)
@@ -139,20 +179,76 @@ impl IndexManager {
             )
             .map_err(|e| MkbError::Index(e.to_string()))?;
 
+        // Indexes created before int8 quantization hold a float[] vec0 table;
+        // drop it so it is recreated below and refilled from the stored f32s.
+        let vec_sql: Option<String> = self
+            .conn
+            .query_row(
+                "SELECT sql FROM sqlite_master WHERE name = 'vec_documents'",
+                [],
+                |row| row.get(0),
+            )
+            .optional()
+            .map_err(|e| MkbError::Index(e.to_string()))?;
+        let rebuild = vec_sql.is_some_and(|sql| !sql.contains(VEC_COLUMN_TYPE));
+        if rebuild {
+            self.conn
+                .execute_batch("DROP TABLE vec_documents;")
+                .map_err(|e| MkbError::Index(e.to_string()))?;
+        }
+
         // Create virtual vec0 table for vector search (sqlite-vec).
         // This is idempotent — sqlite-vec handles IF NOT EXISTS internally.
         self.conn
             .execute_batch(&format!(
                 "CREATE VIRTUAL TABLE IF NOT EXISTS vec_documents USING vec0(
                     id TEXT PRIMARY KEY,
-                    embedding float[{EMBEDDING_DIM}]
+                    embedding {VEC_COLUMN_TYPE}[{EMBEDDING_DIM}] distance_metric=cosine
                 );"
             ))
             .map_err(|e| MkbError::Index(e.to_string()))?;
 
+        if rebuild {
+            self.rebuild_vec_index()?;
+        }
+
         Ok(())
     }
 
+    /// Refill `vec_documents` from the full-precision `document_embeddings`.
+    fn rebuild_vec_index(&self) -> Result<(), MkbError> {
+        let mut stmt = self
+            .conn
+            .prepare("SELECT id, embedding FROM document_embeddings")
+            .map_err(|e| MkbError::Index(e.to_string()))?;
+        let rows = stmt
+            .query_map([], |row| {
+                Ok((row.get::<_, String>(0)?, row.get::<_, Vec<u8>>(1)?))
+            })
+            .map_err(|e| MkbError::Index(e.to_string()))?
+            .collect::<std::result::Result<Vec<_>, _>>()
+            .map_err(|e| MkbError::Index(e.to_string()))?;
+        drop(stmt);
+
+        let tx = self
+            .conn
+            .unchecked_transaction()
+            .map_err(|e| MkbError::Index(e.to_string()))?;
+        for (doc_id, blob) in rows {
+            let embedding: Vec<f32> = blob
+                .chunks_exact(4)
+                .map(|b| f32::from_ne_bytes([b[0], b[1], b[2], b[3]]))
+                .collect();
+            self.conn
+                .execute(
+                    "INSERT INTO vec_documents (id, embedding) VALUES (?1, vec_int8(?2))",
+                    params![doc_id, quantize_int8(&embedding).as_bytes()],
+                )
+                .map_err(|e| MkbError::Index(format!("Vec index rebuild failed: {e}")))?;
+        }
+        tx.commit().map_err(|e| MkbError::Index(e.to_string()))
+    }
+
     /// Index a document (insert or replace).
     ///
     /// # Errors
@@ -191,6 +287,24 @@ impl IndexManager {
         Ok(())
     }
 
+    /// Index many documents in a single transaction.
+    ///
+    /// Either every document is indexed or none is.
+    ///
+    /// # Errors
+    ///
+    /// Returns [`MkbError::Index`] if any insert or the commit fails.
+    pub fn index_documents(&self, docs: &[Document]) -> Result<(), MkbError> {
+        let tx = self
+            .conn
+            .unchecked_transaction()
+            .map_err(|e| MkbError::Index(e.to_string()))?;
+        for doc in docs {
+            self.index_document(doc)?;
+        }
+        tx.commit().map_err(|e| MkbError::Index(e.to_string()))
+    }
+
     /// Remove a document from the index.
     ///
     /// # Errors
@@ -616,21 +730,45 @@ impl IndexManager {
             )
             .map_err(|e| MkbError::Index(format!("Store embedding failed: {e}")))?;
 
-        // Insert into vec0 virtual table for vector search
+        // Insert the int8-quantized vector into vec0 for vector search
         self.conn
             .execute(
                 "INSERT OR REPLACE INTO vec_documents (id, embedding)
-                 VALUES (?1, ?2)",
-                params![doc_id, blob],
+                 VALUES (?1, vec_int8(?2))",
+                params![doc_id, quantize_int8(embedding).as_bytes()],
             )
             .map_err(|e| MkbError::Index(format!("Vec index insert failed: {e}")))?;
 
         Ok(())
     }
 
+    /// Store embeddings for many documents in a single transaction.
+    ///
+    /// Either every embedding is stored or none is.
+    ///
+    /// # Errors
+    ///
+    /// Returns [`MkbError::Index`] if any embedding has the wrong dimension
+    /// or an insert fails.
+    pub fn store_embeddings(
+        &self,
+        items: &[(String, Vec<f32>)],
+        model: &str,
+    ) -> Result<(), MkbError> {
+        let tx = self
+            .conn
+            .unchecked_transaction()
+            .map_err(|e| MkbError::Index(e.to_string()))?;
+        for (doc_id, embedding) in items {
+            self.store_embedding(doc_id, embedding, model)?;
+        }
+        tx.commit().map_err(|e| MkbError::Index(e.to_string()))
+    }
+
     /// Search for similar documents using vector similarity (KNN).
     ///
-    /// Returns document IDs with their distance scores, ordered by similarity.
+    /// Returns document IDs with their cosine distance scores (computed on
+    /// the int8-quantized vectors), ordered by similarity.
     ///
     /// # Errors
     ///
@@ -647,7 +785,8 @@ impl IndexManager {
             )));
         }
 
-        let blob = query_embedding.as_bytes();
+        let query = quantize_int8(query_embedding);
+        let blob = query.as_bytes();
 
         let mut stmt = self
             .conn
@@ -655,7 +794,7 @@ impl IndexManager {
                 "SELECT v.id, v.distance, d.title, d.doc_type
                  FROM vec_documents v
                  JOIN documents d ON d.id = v.id
-                 WHERE v.embedding MATCH ?1
+                 WHERE v.embedding MATCH vec_int8(?1)
                    AND k = ?2
                  ORDER BY v.distance",
             )
@@ -694,6 +833,53 @@ impl IndexManager {
         Ok(count > 0)
     }
 
+    /// List the IDs of all documents with a stored embedding.
+    ///
+    /// # Errors
+    ///
+    /// Returns [`MkbError::Index`] if the query fails.
+    pub fn embedded_ids(&self) -> Result<Vec<String>, MkbError> {
+        let mut stmt = self
+            .conn
+            .prepare("SELECT id FROM document_embeddings")
+            .map_err(|e| MkbError::Index(e.to_string()))?;
+        let ids = stmt
+            .query_map([], |row| row.get(0))
+            .map_err(|e| MkbError::Index(e.to_string()))?
+            .collect::<std::result::Result<Vec<String>, _>>()
+            .map_err(|e| MkbError::Index(e.to_string()))?;
+        Ok(ids)
+    }
+
+    /// List the ID and type of every document without a stored embedding,
+    /// in the order of [`Self::query_all`].
+    ///
+    /// # Errors
+    ///
+    /// Returns [`MkbError::Index`] if the query fails.
+    pub fn unembedded_documents(&self) -> Result<Vec<UnembeddedDocument>, MkbError> {
+        let mut stmt = self
+            .conn
+            .prepare(
+                "SELECT d.id, d.doc_type
+                 FROM documents d
+                 WHERE NOT EXISTS (SELECT 1 FROM document_embeddings e WHERE e.id = d.id)
+                 ORDER BY d.observed_at DESC",
+            )
+            .map_err(|e| MkbError::Index(e.to_string()))?;
+        let docs = stmt
+            .query_map([], |row| {
+                Ok(UnembeddedDocument {
+                    id: row.get(0)?,
+                    doc_type: row.get(1)?,
+                })
+            })
+            .map_err(|e| MkbError::Index(e.to_string()))?
+            .collect::<std::result::Result<Vec<_>, _>>()
+            .map_err(|e| MkbError::Index(e.to_string()))?;
+        Ok(docs)
+    }
+
     /// Remove embedding for a document.
     ///
     /// # Errors
@@ -779,6 +965,14 @@ pub struct IndexedDocument {
     pub confidence: f64,
 }
 
+/// A document still awaiting an embedding, located by ID and type so its
+/// text can be read from the vault.
+#[derive(Debug, Clone)]
+pub struct UnembeddedDocument {
+    pub id: String,
+    pub doc_type: String,
+}
+
 /// Generate a deterministic mock embedding from text using SHA-256.
 ///
 /// This is the Rust port of `MockEmbeddingBackend.generate()` from Python.
@@ -795,8 +989,12 @@ pub fn mock_embedding(text: &str) -> Vec<f32> {
         let hash = hasher.finalize();
         // Interpret first 4 bytes as f32
         let val = f32::from_le_bytes([hash[0], hash[1], hash[2], hash[3]]);
-        // Clamp to [-1, 1]
-        let val = val.clamp(-1.0e38, 1.0e38) / 1.0e38;
+        // Clamp to [-1, 1]; NaN maps to 1.0 as in Python's min/max clamp
+        let val = if val.is_nan() {
+            1.0
+        } else {
+            val.clamp(-1.0e38, 1.0e38) / 1.0e38
+        };
         let val = val.clamp(-1.0, 1.0);
         vec.push(val);
     }
@@ -964,6 +1162,19 @@ mod tests {
         assert_eq!(results[0].title, "Updated");
     }
 
+    #[test]
+    fn index_documents_inserts_batch() {
+        let mgr = IndexManager::in_memory().unwrap();
+
+        let docs = vec![
+            make_doc("d1", "project", "Alpha", "body1"),
+            make_doc("d2", "meeting", "Sprint Review", "body2"),
+        ];
+        mgr.index_documents(&docs).unwrap();
+
+        assert_eq!(mgr.count().unwrap(), 2);
+    }
+
     // === T-110.3 tests: link indexing ===
 
     #[test]
@@ -1246,6 +1457,24 @@ mod tests {
         assert!(mgr.has_embedding("d1").unwrap());
         assert!(!mgr.has_embedding("d2").unwrap());
         assert_eq!(mgr.embedding_count().unwrap(), 1);
+        assert_eq!(mgr.embedded_ids().unwrap(), vec!["d1".to_string()]);
+    }
+
+    #[test]
+    fn unembedded_documents_lists_pending_documents() {
+        let mgr = IndexManager::in_memory().unwrap();
+
+        mgr.index_document(&make_doc("d1", "project", "Alpha", "alpha body"))
+            .unwrap();
+        mgr.index_document(&make_doc("d2", "project", "Beta", "beta body"))
+            .unwrap();
+        mgr.store_embedding("d2", &test_embedding("beta"), "test-model")
+            .unwrap();
+
+        let pending = mgr.unembedded_documents().unwrap();
+        assert_eq!(pending.len(), 1);
+        assert_eq!(pending[0].id, "d1");
+        assert_eq!(pending[0].doc_type, "project");
     }
 
     #[test]
@@ -1271,6 +1500,58 @@ mod tests {
         assert!(results[0].distance < results[1].distance);
     }
 
+    #[test]
+    fn semantic_search_returns_k_nearest() {
+        let mgr = IndexManager::in_memory().unwrap();
+
+        for i in 0..20 {
+            let id = format!("d{i}");
+            mgr.index_document(&make_doc(&id, "project", &id, "body"))
+                .unwrap();
+            mgr.store_embedding(&id, &test_embedding(&id), "test-model")
+                .unwrap();
+        }
+
+        let results = mgr.search_semantic(&test_embedding("d7"), 5).unwrap();
+        assert_eq!(results.len(), 5);
+        assert_eq!(results[0].id, "d7");
+        assert!(results.windows(2).all(|w| w[0].distance <= w[1].distance));
+    }
+
+    #[test]
+    fn quantize_int8_scales_to_full_range() {
+        let q = quantize_int8(&[0.5, -0.25, 0.0, -0.5]);
+        assert_eq!(q, vec![127, -64, 0, -127]);
+        assert_eq!(quantize_int8(&[0.0, 0.0]), vec![0, 0]);
+    }
+
+    #[test]
+    fn legacy_float_vec_table_is_rebuilt_as_int8() {
+        let mgr = IndexManager::in_memory().unwrap();
+        mgr.index_document(&make_doc("d1", "project", "Alpha", "body"))
+            .unwrap();
+        mgr.store_embedding("d1", &test_embedding("d1"), "test-model")
+            .unwrap();
+
+        // Recreate the pre-quantization float[] table, leaving it empty
+        mgr.conn
+            .execute_batch(&format!(
+                "DROP TABLE vec_documents;
+                 CREATE VIRTUAL TABLE vec_documents USING vec0(
+                     id TEXT PRIMARY KEY,
+                     embedding float[{EMBEDDING_DIM}]
+                 );"
+            ))
+            .unwrap();
+
+        mgr.create_schema().unwrap();
+
+        let results = mgr.search_semantic(&test_embedding("d1"), 1).unwrap();
+        assert_eq!(results.len(), 1);
+        assert_eq!(results[0].id, "d1");
+        assert!(results[0].distance < 0.01);
+    }
+
     #[test]
     fn embedding_dimension_mismatch_rejected() {
         let mgr = IndexManager::in_memory().unwrap();
@@ -1287,6 +1568,30 @@ mod tests {
             .contains("dimension mismatch"));
     }
 
+    #[test]
+    fn store_embeddings_batch_is_atomic() {
+        let mgr = IndexManager::in_memory().unwrap();
+
+        for id in ["d1", "d2"] {
+            mgr.index_document(&make_doc(id, "project", id, "body"))
+                .unwrap();
+        }
+
+        let bad = vec![
+            ("d1".to_string(), test_embedding("d1")),
+            ("d2".to_string(), vec![0.0f32; 768]),
+        ];
+        assert!(mgr.store_embeddings(&bad, "test-model").is_err());
+        assert_eq!(mgr.embedding_count().unwrap(), 0);
+
+        let good = vec![
+            ("d1".to_string(), test_embedding("d1")),
+            ("d2".to_string(), test_embedding("d2")),
+        ];
+        mgr.store_embeddings(&good, "test-model").unwrap();
+        assert_eq!(mgr.embedding_count().unwrap(), 2);
+    }
+
     #[test]
     fn remove_embedding_works() {
         let mgr = IndexManager::in_memory().unwrap();
@@ -1328,6 +1633,25 @@ mod tests {
         }
     }
 
+    #[test]
+    fn open_uses_wal_journal() {
+        // A test-mode variable leaked from the environment would switch modes
+        std::env::remove_var(TEST_IN_MEMORY_ENV);
+        let dir = tempfile::TempDir::new().unwrap();
+        let mgr = IndexManager::open(&dir.path().join("test.db")).unwrap();
+
+        let mode: String = mgr
+            .conn
+            .query_row("PRAGMA journal_mode", [], |row| row.get(0))
+            .unwrap();
+        assert_eq!(mode, "wal");
+        let synchronous: i64 = mgr
+            .conn
+            .query_row("PRAGMA synchronous", [], |row| row.get(0))
+            .unwrap();
+        assert_eq!(synchronous, 1); // NORMAL
+    }
+
     #[test]
     fn full_rebuild_matches_incremental_index() {
         // Build incrementally
@@ -1360,4 +1684,20 @@ mod tests {
             assert_eq!(a.title, b.title);
         }
     }
+
+    #[test]
+    fn mock_embedding_matches_python_mock() {
+        // Pinned from MockEmbeddingBackend().generate("mkb mock parity") in
+        // tests/python/test_embeddings.py; index 21 hashes to a NaN.
+        let emb = mock_embedding("mkb mock parity");
+        assert_eq!(emb.len(), EMBEDDING_DIM);
+        for (i, expected) in [
+            (21, 0.249_840_69),
+            (113, -0.162_128_85),
+            (271, 0.208_493_62),
+            (661, -0.249_840_69),
+        ] {
+            assert!((emb[i] - expected).abs() < 1e-6, "dimension {i}");
+        }
+    }
 }
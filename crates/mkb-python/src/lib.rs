@@ -6,11 +6,14 @@
 //! All functions take vault_path as first argument (path-based API,
 //! no persistent handles across FFI boundary).
 
+use std::collections::HashSet;
 use std::path::Path;
+use std::sync::LazyLock;
 
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 use pyo3::types::PyDict;
+use regex::Regex;
 
 use chrono::{DateTime, Utc};
 
@@ -44,6 +47,54 @@ fn parse_datetime(s: &str) -> PyResult<DateTime<Utc>> {
         .map_err(|e| PyValueError::new_err(format!("Invalid datetime '{s}': {e}")))
 }
 
+fn dict_str(dict: &Bound<'_, PyDict>, key: &str) -> PyResult<Option<String>> {
+    match dict.get_item(key)? {
+        Some(v) if !v.is_none() => Ok(Some(v.extract::<String>()?)),
+        _ => Ok(None),
+    }
+}
+
+fn required_str(dict: &Bound<'_, PyDict>, key: &str) -> PyResult<String> {
+    dict_str(dict, key)?.ok_or_else(|| PyValueError::new_err(format!("Missing field: {key}")))
+}
+
+/// Build a validated document with the next free ID for its type and title.
+#[allow(clippy::too_many_arguments)]
+fn build_document(
+    vault_path: &Path,
+    doc_type: &str,
+    title: &str,
+    observed_at: &str,
+    body: &str,
+    tags: Option<Vec<String>>,
+    precision: &str,
+    valid_until: Option<&str>,
+) -> PyResult<Document> {
+    let observed = parse_datetime(observed_at)?;
+    let valid = valid_until.map(parse_datetime).transpose()?;
+    let prec = parse_precision(precision)?;
+    let profile = DecayProfile::default_profile();
+
+    let counter = mkb_vault::next_counter(vault_path, doc_type, &mkb_vault::slugify(title));
+    let id = Document::generate_id(doc_type, title, counter);
+
+    let input = RawTemporalInput {
+        observed_at: Some(observed),
+        valid_until: valid,
+        temporal_precision: Some(prec),
+        occurred_at: None,
+    };
+
+    let mut doc = Document::new(id, doc_type.to_string(), title.to_string(), input, &profile)
+        .map_err(|e| PyValueError::new_err(format!("Temporal gate rejected: {e}")))?;
+
+    doc.body = body.to_string();
+    if let Some(t) = tags {
+        doc.tags = t;
+    }
+    Ok(doc)
+}
+
 fn doc_to_dict(py: Python<'_>, doc: &Document) -> PyResult<Py<PyDict>> {
     let dict = PyDict::new(py);
     dict.set_item("id", &doc.id)?;
@@ -103,28 +154,16 @@ fn create_document(
         Vault::open(vpath).map_err(|e| PyValueError::new_err(format!("Vault error: {e}")))?;
     let index = open_index(vpath)?;
 
-    let observed = parse_datetime(observed_at)?;
-    let valid = valid_until.map(parse_datetime).transpose()?;
-    let prec = parse_precision(precision)?;
-    let profile = DecayProfile::default_profile();
-
-    let counter = mkb_vault::next_counter(vpath, doc_type, &mkb_vault::slugify(title));
-    let id = Document::generate_id(doc_type, title, counter);
-
-    let input = RawTemporalInput {
-        observed_at: Some(observed),
-        valid_until: valid,
-        temporal_precision: Some(prec),
-        occurred_at: None,
-    };
-
-    let mut doc = Document::new(id, doc_type.to_string(), title.to_string(), input, &profile)
-        .map_err(|e| PyValueError::new_err(format!("Temporal gate rejected: {e}")))?;
-
-    doc.body = body.to_string();
-    if let Some(t) = tags {
-        doc.tags = t;
-    }
+    let doc = build_document(
+        vpath,
+        doc_type,
+        title,
+        observed_at,
+        body,
+        tags,
+        precision,
+        valid_until,
+    )?;
 
     let _path = vault
         .create(&doc)
@@ -136,6 +175,83 @@ fn create_document(
     doc_to_dict(py, &doc)
 }
 
+/// Create many documents in the vault, indexing them in one transaction.
+///
+/// Each entry is a dict with the keys accepted by `create_document`:
+/// `doc_type`, `title` and `observed_at` are required; `body`, `tags`,
+/// `precision` and `valid_until` are optional. If an entry fails, the
+/// documents created before it stay in the vault and are indexed, and the
+/// error is raised.
+#[pyfunction]
+fn create_documents_batch(
+    py: Python<'_>,
+    vault_path: &str,
+    docs: Vec<Bound<'_, PyDict>>,
+) -> PyResult<Vec<Py<PyDict>>> {
+    let vpath = Path::new(vault_path);
+    let vault =
+        Vault::open(vpath).map_err(|e| PyValueError::new_err(format!("Vault error: {e}")))?;
+    let index = open_index(vpath)?;
+
+    let mut created = Vec::with_capacity(docs.len());
+    let mut failure = None;
+    for entry in &docs {
+        match create_batch_entry(&vault, vpath, entry) {
+            Ok(doc) => created.push(doc),
+            Err(e) => {
+                failure = Some(e);
+                break;
+            }
+        }
+    }
+
+    // Index the documents already written even when a later entry failed,
+    // so the vault and index never diverge
+    index
+        .index_documents(&created)
+        .map_err(|e| PyValueError::new_err(format!("Index failed: {e}")))?;
+    if let Some(e) = failure {
+        return Err(e);
+    }
+
+    created.iter().map(|doc| doc_to_dict(py, doc)).collect()
+}
+
+/// Build one `create_documents_batch` entry and write it to the vault.
+///
+/// Writes before the next entry is built so `next_counter` sees it.
+fn create_batch_entry(
+    vault: &Vault,
+    vpath: &Path,
+    entry: &Bound<'_, PyDict>,
+) -> PyResult<Document> {
+    let doc_type = required_str(entry, "doc_type")?;
+    let title = required_str(entry, "title")?;
+    let observed_at = required_str(entry, "observed_at")?;
+    let body = dict_str(entry, "body")?.unwrap_or_default();
+    let tags = match entry.get_item("tags")? {
+        Some(v) if !v.is_none() => Some(v.extract::<Vec<String>>()?),
+        _ => None,
+    };
+    let precision = dict_str(entry, "precision")?.unwrap_or_else(|| "day".to_string());
+    let valid_until = dict_str(entry, "valid_until")?;
+
+    let doc = build_document(
+        vpath,
+        &doc_type,
+        &title,
+        &observed_at,
+        &body,
+        tags,
+        &precision,
+        valid_until.as_deref(),
+    )?;
+    vault
+        .create(&doc)
+        .map_err(|e| PyValueError::new_err(format!("Create failed: {e}")))?;
+    Ok(doc)
+}
+
 /// Read a document from the vault.
 #[pyfunction]
 fn read_document(
@@ -155,6 +271,29 @@ fn read_document(
     doc_to_dict(py, &doc)
 }
 
+/// Read several documents from the vault in one call.
+///
+/// `refs` holds `(doc_type, id)` pairs; documents are returned in the same
+/// order, as `read_document` dicts.
+#[pyfunction]
+fn read_documents(
+    py: Python<'_>,
+    vault_path: &str,
+    refs: Vec<(String, String)>,
+) -> PyResult<Vec<Py<PyDict>>> {
+    let vault = Vault::open(Path::new(vault_path))
+        .map_err(|e| PyValueError::new_err(format!("Vault error: {e}")))?;
+
+    refs.iter()
+        .map(|(doc_type, id)| {
+            let doc = vault
+                .read(doc_type, id)
+                .map_err(|e| PyValueError::new_err(format!("Read failed: {e}")))?;
+            doc_to_dict(py, &doc)
+        })
+        .collect()
+}
+
 /// Delete a document (soft delete to archive).
 #[pyfunction]
 fn delete_document(vault_path: &str, doc_type: &str, id: &str) -> PyResult<String> {
@@ -365,6 +504,21 @@ fn store_embedding(
         .map_err(|e| PyValueError::new_err(format!("Store embedding failed: {e}")))
 }
 
+/// Store embedding vectors for many documents in one transaction.
+///
+/// `items` is a list of `(doc_id, embedding)` pairs sharing one model.
+#[pyfunction]
+fn store_embeddings_batch(
+    vault_path: &str,
+    items: Vec<(String, Vec<f32>)>,
+    model: &str,
+) -> PyResult<()> {
+    let index = open_index(Path::new(vault_path))?;
+    index
+        .store_embeddings(&items, model)
+        .map_err(|e| PyValueError::new_err(format!("Store embeddings failed: {e}")))
+}
+
 /// Search for similar documents using vector similarity.
 #[pyfunction]
 #[pyo3(signature = (vault_path, query_embedding, limit=10))]
@@ -402,6 +556,29 @@ fn has_embedding(vault_path: &str, doc_id: &str) -> PyResult<bool> {
         .map_err(|e| PyValueError::new_err(format!("Has embedding check failed: {e}")))
 }
 
+/// Get the IDs of all documents that have an embedding.
+#[pyfunction]
+fn embedded_doc_ids(vault_path: &str) -> PyResult<HashSet<String>> {
+    let index = open_index(Path::new(vault_path))?;
+    index
+        .embedded_ids()
+        .map(|ids| ids.into_iter().collect())
+        .map_err(|e| PyValueError::new_err(format!("Embedded ids query failed: {e}")))
+}
+
+/// List the type and ID of every document without an embedding.
+///
+/// Returns `(doc_type, id)` pairs for `read_documents`, so callers can
+/// read pending documents a batch at a time.
+#[pyfunction]
+fn unembedded_documents(vault_path: &str) -> PyResult<Vec<(String, String)>> {
+    let index = open_index(Path::new(vault_path))?;
+    index
+        .unembedded_documents()
+        .map(|docs| docs.into_iter().map(|d| (d.doc_type, d.id)).collect())
+        .map_err(|e| PyValueError::new_err(format!("Unembedded documents query failed: {e}")))
+}
+
 /// Get count of documents with embeddings.
 #[pyfunction]
 fn embedding_count(vault_path: &str) -> PyResult<u64> {
@@ -417,15 +594,107 @@ fn embedding_dim() -> usize {
     mkb_index::EMBEDDING_DIM
 }
 
+// === Entity Extraction ===
+
+/// Entity patterns in the order of `mkb_ai.extraction.entities._KIND_PATTERNS`,
+/// each with the capture group that holds the entity value.
+const ENTITY_PATTERNS: [(&str, usize); 5] = [
+    (r"\b([A-Z][A-Z0-9]+-\d+)\b", 1),
+    (r"@(\w[\w.-]*\w|\w)", 1),
+    (
+        r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\s*\((?:CEO|CTO|VP|Director|Manager|Lead|Engineer|PM|Designer|Analyst)\)",
+        1,
+    ),
+    (r#"(?i)https?://[^\s<>"')\]]+"#, 0),
+    (r"\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b", 0),
+];
+
+static ENTITY_REGEXES: LazyLock<Vec<Regex>> = LazyLock::new(|| {
+    ENTITY_PATTERNS
+        .iter()
+        .map(|(pattern, _)| Regex::new(pattern).expect("entity pattern compiles"))
+        .collect()
+});
+
+/// Match the selected entity patterns against text.
+///
+/// Returns `(pattern, value_start, value_end, start, end)` per match, in
+/// pattern order, with offsets in characters so Python can slice with them.
+fn scan_entities(text: &str, patterns: &[usize]) -> Vec<(usize, usize, usize, usize, usize)> {
+    let ascii = text.is_ascii();
+    let mut matches = Vec::new();
+    for &idx in patterns {
+        let group = ENTITY_PATTERNS[idx].1;
+        // A pattern's match boundaries ascend, so one cursor per pattern
+        // converts them in a single pass over the text
+        let mut cursor = CharCursor::default();
+        let mut at = |byte: usize| {
+            if ascii {
+                byte
+            } else {
+                cursor.advance(text, byte)
+            }
+        };
+        for caps in ENTITY_REGEXES[idx].captures_iter(text) {
+            let whole = caps.get(0).expect("group 0 always matches");
+            let value = caps.get(group).unwrap_or(whole);
+            let start = at(whole.start());
+            let value_start = at(value.start());
+            let value_end = at(value.end());
+            let end = at(whole.end());
+            matches.push((idx, value_start, value_end, start, end));
+        }
+    }
+    matches
+}
+
+/// Converts ascending byte offsets into a text to character offsets.
+#[derive(Default)]
+struct CharCursor {
+    byte: usize,
+    chars: usize,
+}
+
+impl CharCursor {
+    fn advance(&mut self, text: &str, byte: usize) -> usize {
+        self.chars += text[self.byte..byte].chars().count();
+        self.byte = byte;
+        self.chars
+    }
+}
+
+/// Scan text for entities with the native regex engine.
+///
+/// `patterns` selects entity patterns by index (all when omitted). Runs
+/// without the GIL so extraction threads scan in parallel.
+#[pyfunction]
+#[pyo3(signature = (text, patterns=None))]
+fn entity_scan(
+    py: Python<'_>,
+    text: &str,
+    patterns: Option<Vec<usize>>,
+) -> PyResult<Vec<(usize, usize, usize, usize, usize)>> {
+    let patterns = patterns.unwrap_or_else(|| (0..ENTITY_PATTERNS.len()).collect());
+    if let Some(&bad) = patterns.iter().find(|&&i| i >= ENTITY_PATTERNS.len()) {
+        return Err(PyValueError::new_err(format!(
+            "Unknown entity pattern index: {bad}"
+        )));
+    }
+    Ok(py.detach(|| scan_entities(text, &patterns)))
+}
+
 /// MKB Python module.
 #[pymodule]
 fn _mkb_core(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add("__version__", env!("CARGO_PKG_VERSION"))?;
+    m.add("EMBEDDING_DIM", mkb_index::EMBEDDING_DIM)?;
 
     // Vault CRUD (T-400.1)
     m.add_function(wrap_pyfunction!(init_vault, m)?)?;
     m.add_function(wrap_pyfunction!(create_document, m)?)?;
+    m.add_function(wrap_pyfunction!(create_documents_batch, m)?)?;
     m.add_function(wrap_pyfunction!(read_document, m)?)?;
+    m.add_function(wrap_pyfunction!(read_documents, m)?)?;
     m.add_function(wrap_pyfunction!(delete_document, m)?)?;
 
     // Index operations (T-400.2)
@@ -439,11 +708,17 @@ fn _mkb_core(m: &Bound<'_, PyModule>) -> PyResult<()> {
 
     // Embedding operations (T-410)
     m.add_function(wrap_pyfunction!(store_embedding, m)?)?;
+    m.add_function(wrap_pyfunction!(store_embeddings_batch, m)?)?;
     m.add_function(wrap_pyfunction!(search_semantic, m)?)?;
     m.add_function(wrap_pyfunction!(has_embedding, m)?)?;
+    m.add_function(wrap_pyfunction!(embedded_doc_ids, m)?)?;
+    m.add_function(wrap_pyfunction!(unembedded_documents, m)?)?;
     m.add_function(wrap_pyfunction!(embedding_count, m)?)?;
     m.add_function(wrap_pyfunction!(embedding_dim, m)?)?;
 
+    // Entity extraction
+    m.add_function(wrap_pyfunction!(entity_scan, m)?)?;
+
     // Utility
     m.add_function(wrap_pyfunction!(document_count, m)?)?;
     m.add_function(wrap_pyfunction!(vault_status, m)?)?;
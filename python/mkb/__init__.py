@@ -5,37 +5,51 @@ go through the native `_mkb_core` extension module built via PyO3.
 """
 
 from mkb._mkb_core import (  # type: ignore[import-untyped]
+    EMBEDDING_DIM,
     __version__,
     create_document,
+    create_documents_batch,
     delete_document,
     document_count,
+    embedded_doc_ids,
     embedding_count,
     embedding_dim,
+    entity_scan,
     has_embedding,
     init_vault,
     query_all,
     query_by_type,
     query_mkql,
     read_document,
+    read_documents,
     search_fts,
     search_semantic,
     store_embedding,
+    store_embeddings_batch,
+    unembedded_documents,
     validate_temporal,
     vault_status,
 )
 
 __all__ = [
     "__version__",
+    "EMBEDDING_DIM",
     "init_vault",
     "create_document",
+    "create_documents_batch",
     "read_document",
+    "read_documents",
     "delete_document",
     "search_fts",
     "search_semantic",
     "store_embedding",
+    "store_embeddings_batch",
     "has_embedding",
+    "embedded_doc_ids",
+    "unembedded_documents",
     "embedding_count",
     "embedding_dim",
+    "entity_scan",
     "query_mkql",
     "query_all",
     "query_by_type",
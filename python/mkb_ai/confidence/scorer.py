@@ -9,7 +9,13 @@ Assigns a confidence score (0.0–1.0) based on:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy as np
 
 
 @dataclass
@@ -46,6 +52,11 @@ _PRECISION_WEIGHTS: dict[str, float] = {
     "inferred": 0.4,
 }
 
+# ConfidenceScorer fields packed into its _weights tuple
+_WEIGHT_FIELDS = frozenset(
+    {"source_weight", "precision_weight", "completeness_weight", "corroboration_weight"}
+)
+
 
 @dataclass
 class ConfidenceScorer:
@@ -63,6 +74,28 @@ class ConfidenceScorer:
     completeness_weight: float = 0.3
     corroboration_weight: float = 0.2
 
+    _weights: tuple[float, float, float, float] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._pack_weights()
+
+    def __setattr__(self, name: str, value: object) -> None:
+        object.__setattr__(self, name, value)
+        # Keep the packed tuple current when a weight is changed later
+        if name in _WEIGHT_FIELDS and "_weights" in self.__dict__:
+            self._pack_weights()
+
+    def _pack_weights(self) -> None:
+        """Pack the four weights for unpacking in one statement per call."""
+        self._weights = (
+            self.source_weight,
+            self.precision_weight,
+            self.completeness_weight,
+            self.corroboration_weight,
+        )
+
     def score(
         self,
         source: str | None = None,
@@ -82,23 +115,18 @@ class ConfidenceScorer:
         precision_score = _PRECISION_WEIGHTS.get(precision.lower(), 0.5)
 
         # Completeness score (0-1 based on filled fields)
-        completeness_checks: list[bool] = [
-            has_observed_at,
-            has_body,
-            has_tags,
-            has_links,
-        ]
-        completeness_score = sum(completeness_checks) / len(completeness_checks)
+        completeness_score = (has_observed_at + has_body + has_tags + has_links) * 0.25
 
         # Corroboration bonus (diminishing returns)
         corroboration_bonus = min(1.0, corroboration_count * 0.2)
 
         # Weighted combination
+        source_w, precision_w, completeness_w, corroboration_w = self._weights
         final = (
-            self.source_weight * source_score
-            + self.precision_weight * precision_score
-            + self.completeness_weight * completeness_score
-            + self.corroboration_weight * corroboration_bonus
+            source_w * source_score
+            + precision_w * precision_score
+            + completeness_w * completeness_score
+            + corroboration_w * corroboration_bonus
         )
 
         return ScoreBreakdown(
@@ -109,6 +137,107 @@ class ConfidenceScorer:
             final_score=round(min(1.0, final), 3),
         )
 
+    def score_fast(
+        self,
+        source: str | None = None,
+        precision: str = "day",
+        has_body: bool = False,
+        has_tags: bool = False,
+        has_links: bool = False,
+        has_observed_at: bool = True,
+        corroboration_count: int = 0,
+    ) -> float:
+        """Calculate only the final score, without building a breakdown.
+
+        Equal to ``score(...).final_score``.
+        """
+        completeness_score = (has_observed_at + has_body + has_tags + has_links) * 0.25
+        source_w, precision_w, completeness_w, corroboration_w = self._weights
+        final = (
+            source_w * _SOURCE_WEIGHTS.get((source or "unknown").lower(), 0.6)
+            + precision_w * _PRECISION_WEIGHTS.get(precision.lower(), 0.5)
+            + completeness_w * completeness_score
+            + corroboration_w * min(1.0, corroboration_count * 0.2)
+        )
+        return round(min(1.0, final), 3)
+
+    def score_many(
+        self,
+        sources: Sequence[str | None],
+        precisions: Sequence[str] | None = None,
+        has_body: Sequence[bool] | None = None,
+        has_tags: Sequence[bool] | None = None,
+        has_links: Sequence[bool] | None = None,
+        has_observed_at: Sequence[bool] | None = None,
+        corroboration_counts: Sequence[int] | None = None,
+    ) -> np.ndarray:
+        """Calculate final scores for many documents in one vectorized pass.
+
+        Each argument holds one value per document, aligned with
+        ``sources``; omitted arguments take the defaults of ``score``.
+        Returns an array of final scores without building breakdowns.
+
+        Raises ValueError if a given argument's length differs from
+        ``sources``.
+        """
+        # Imported here so single-document scoring does not load NumPy
+        import numpy as np
+
+        n = len(sources)
+        columns = {
+            "precisions": precisions,
+            "has_body": has_body,
+            "has_tags": has_tags,
+            "has_links": has_links,
+            "has_observed_at": has_observed_at,
+            "corroboration_counts": corroboration_counts,
+        }
+        for name, values in columns.items():
+            if values is not None and len(values) != n:
+                raise ValueError(f"{name} has {len(values)} values for {n} sources")
+
+        source_scores = np.fromiter(
+            (_SOURCE_WEIGHTS.get((s or "unknown").lower(), 0.6) for s in sources),
+            dtype=np.float64,
+            count=n,
+        )
+        if precisions is None:
+            precision_scores = np.full(n, _PRECISION_WEIGHTS["day"])
+        else:
+            precision_scores = np.fromiter(
+                (_PRECISION_WEIGHTS.get(p.lower(), 0.5) for p in precisions),
+                dtype=np.float64,
+                count=n,
+            )
+        completeness_scores = (
+            _column(has_observed_at, n, default=1.0)
+            + _column(has_body, n)
+            + _column(has_tags, n)
+            + _column(has_links, n)
+        ) / 4
+        corroboration_bonus = np.minimum(1.0, _column(corroboration_counts, n) * 0.2)
+
+        source_w, precision_w, completeness_w, corroboration_w = self._weights
+        final = (
+            source_w * source_scores
+            + precision_w * precision_scores
+            + completeness_w * completeness_scores
+            + corroboration_w * corroboration_bonus
+        )
+        scores: np.ndarray = np.round(np.minimum(1.0, final), 3)
+        return scores
+
+
+def _column(
+    values: Sequence[bool] | Sequence[int] | None, n: int, default: float = 0.0
+) -> np.ndarray:
+    """Convert optional per-document values to a float array of length n."""
+    import numpy as np
+
+    if values is None:
+        return np.full(n, default)
+    return np.asarray(values, dtype=np.float64)
+
 
 def score_document(
     doc: dict[str, object],
@@ -119,7 +248,7 @@ def score_document(
     Returns the final confidence score (0.0–1.0).
     """
     scorer = ConfidenceScorer()
-    breakdown = scorer.score(
+    return scorer.score_fast(
         source=str(doc.get("source", "unknown")),
         precision=str(doc.get("temporal_precision", "day")),
         has_body=bool(doc.get("body")),
@@ -128,4 +257,3 @@ def score_document(
         has_observed_at="observed_at" in doc,
         corroboration_count=corroboration_count,
     )
-    return breakdown.final_score
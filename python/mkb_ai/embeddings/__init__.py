@@ -1,5 +1,27 @@
-"""Vector embedding generation and management."""
+"""Vector embedding generation and management.
 
-from mkb_ai.embeddings.generator import EmbeddingGenerator, embed_document, embed_query
+The generator module, and NumPy with it, is imported on first attribute
+access (PEP 562), so importing this package alone stays cheap.
+"""
 
-__all__ = ["EmbeddingGenerator", "embed_document", "embed_query"]
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from mkb_ai.embeddings.generator import (
+        EmbeddingGenerator,
+        clear_query_cache,
+        embed_document,
+        embed_query,
+    )
+
+__all__ = ["EmbeddingGenerator", "clear_query_cache", "embed_document", "embed_query"]
+
+
+def __getattr__(name: str) -> object:
+    if name in __all__:
+        generator = importlib.import_module("mkb_ai.embeddings.generator")
+        return getattr(generator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,9 +6,29 @@ Provides both async and sync interfaces, with a mock backend for testing.
 
 from __future__ import annotations
 
-from typing import Protocol
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Protocol, TypeVar
 
 import mkb
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable
+
+_T = TypeVar("_T")
+
+# Maximum number of texts sent to a backend in one batch request.
+EMBEDDING_BATCH_SIZE = 100
+
+# Query embeddings kept by embed_query, keyed by (backend cache_key, query),
+# least recently used evicted first
+_QUERY_CACHE_SIZE = 1024
+_query_cache: OrderedDict[tuple[Hashable, str], tuple[float, ...]] = OrderedDict()
+_query_cache_lock = threading.Lock()
 
 
 class EmbeddingBackend(Protocol):
@@ -18,6 +38,10 @@ class EmbeddingBackend(Protocol):
         """Generate an embedding vector for the given text."""
         ...
 
+    def generate_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate embedding vectors for several texts, in input order."""
+        ...
+
     @property
     def model_name(self) -> str:
         """Return the model name for metadata tracking."""
@@ -29,6 +53,19 @@ class EmbeddingBackend(Protocol):
         ...
 
 
+class AsyncEmbeddingBackend(Protocol):
+    """Protocol for backends that generate embeddings asynchronously."""
+
+    async def agenerate_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate embedding vectors for several texts, in input order."""
+        ...
+
+    @property
+    def model_name(self) -> str:
+        """Return the model name for metadata tracking."""
+        ...
+
+
 class OpenAIEmbeddingBackend:
     """OpenAI text-embedding-3-small backend."""
 
@@ -46,6 +83,23 @@ class OpenAIEmbeddingBackend:
         )
         return response.data[0].embedding
 
+    def generate_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for many texts, in input order.
+
+        Texts are sorted longest first and sent in requests of up to
+        ``EMBEDDING_BATCH_SIZE``, so each request holds texts of similar
+        length.
+        """
+        order = _longest_first(texts)
+        embeddings: list[list[float]] = []
+        for start in range(0, len(order), EMBEDDING_BATCH_SIZE):
+            response = self._client.embeddings.create(
+                input=[texts[i] for i in order[start : start + EMBEDDING_BATCH_SIZE]],
+                model=self._model,
+            )
+            embeddings.extend(d.embedding for d in response.data)
+        return _restore_order(order, embeddings)
+
     @property
     def model_name(self) -> str:
         return self._model
@@ -54,6 +108,40 @@ class OpenAIEmbeddingBackend:
     def dimensions(self) -> int:
         return 1536
 
+    @property
+    def cache_key(self) -> Hashable:
+        """Identify the vectors this backend returns, for ``embed_query``."""
+        return ("openai", str(self._client.base_url), self._model)
+
+
+class AsyncOpenAIEmbeddingBackend:
+    """OpenAI text-embedding-3-small backend using the async client."""
+
+    def __init__(self, api_key: str | None = None) -> None:
+        import openai
+
+        self._client = openai.AsyncOpenAI(api_key=api_key)
+        self._model = "text-embedding-3-small"
+
+    async def agenerate_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for many texts, in input order.
+
+        Requests are length-sorted as in ``OpenAIEmbeddingBackend``.
+        """
+        order = _longest_first(texts)
+        embeddings: list[list[float]] = []
+        for start in range(0, len(order), EMBEDDING_BATCH_SIZE):
+            response = await self._client.embeddings.create(
+                input=[texts[i] for i in order[start : start + EMBEDDING_BATCH_SIZE]],
+                model=self._model,
+            )
+            embeddings.extend(d.embedding for d in response.data)
+        return _restore_order(order, embeddings)
+
+    @property
+    def model_name(self) -> str:
+        return self._model
+
 
 class MockEmbeddingBackend:
     """Deterministic mock backend for testing (no API calls)."""
@@ -62,22 +150,27 @@ class MockEmbeddingBackend:
         self._model = "mock-embedding"
 
     def generate(self, text: str) -> list[float]:
-        """Generate a deterministic embedding from text hash."""
-        import hashlib
-        import struct
-
-        dim = mkb.embedding_dim()
-        vec: list[float] = []
-        for i in range(dim):
-            h = hashlib.sha256(f"{text}-{i}".encode()).digest()
-            val = struct.unpack("f", h[:4])[0]
-            val = max(-1.0, min(1.0, val / 1e38))
-            vec.append(val)
-        # Normalize
-        norm = sum(v * v for v in vec) ** 0.5
-        if norm > 0:
-            vec = [v / norm for v in vec]
-        return vec
+        """Generate a deterministic embedding from text hash.
+
+        Uses the per-dimension SHA-256 scheme of Rust's
+        ``mkb_index::mock_embedding``, so the Python pipeline and the Rust
+        CLI, MKQL ``NEAR()`` and MCP search embed the same text alike.
+        """
+        out = np.empty(mkb.EMBEDDING_DIM, dtype=np.float32)
+        result: list[float] = _mock_vector(text, out).tolist()
+        return result
+
+    def generate_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate deterministic embeddings for several texts.
+
+        Each text's vector is drawn into a row of one float32 matrix, which
+        is converted to lists in a single call. Rows equal ``generate``.
+        """
+        out = np.empty((len(texts), mkb.EMBEDDING_DIM), dtype=np.float32)
+        for text, row in zip(texts, out, strict=True):
+            _mock_vector(text, row)
+        result: list[list[float]] = out.tolist()
+        return result
 
     @property
     def model_name(self) -> str:
@@ -85,7 +178,12 @@ class MockEmbeddingBackend:
 
     @property
     def dimensions(self) -> int:
-        return int(mkb.embedding_dim())
+        return int(mkb.EMBEDDING_DIM)
+
+    @property
+    def cache_key(self) -> Hashable:
+        """Identify the vectors this backend returns, for ``embed_query``."""
+        return (self._model, self.dimensions)
 
 
 class EmbeddingGenerator:
@@ -105,53 +203,164 @@ class EmbeddingGenerator:
 
     def embed_document(self, doc_id: str) -> None:
         """Generate and store an embedding for a document."""
-        doc = mkb.read_document(
-            self.vault_path,
-            _doc_type_from_id(doc_id),
-            doc_id,
-        )
-        text = _document_to_text(doc)
+        text = self._document_text(doc_id)
         embedding = self.backend.generate(text)
         mkb.store_embedding(
             self.vault_path, doc_id, embedding, self.backend.model_name
         )
 
-    def embed_all(self) -> int:
+    def embed_documents_batch(self, doc_ids: list[str]) -> None:
+        """Generate and store embeddings for several documents.
+
+        All texts go to the backend in one ``generate_batch`` call and are
+        stored in one index transaction.
+        """
+        self._store_batches([doc_ids], [self._generate_batch(doc_ids)], self.backend.model_name)
+
+    def embed_all(self, workers: int = 1) -> int:
         """Embed all documents that don't have embeddings yet.
 
+        Texts are sent to the backend in batches of ``EMBEDDING_BATCH_SIZE``
+        and each batch is stored in one index transaction. A batch's
+        documents are read from the vault only when it is generated, so
+        memory holds the text of in-flight batches, not the whole vault. With
+        ``workers`` > 1, up to that many batches are generated concurrently
+        on a thread pool; results are still stored in order on the calling
+        thread. Returns the number of documents embedded.
+        """
+        pending = mkb.unembedded_documents(self.vault_path)
+        batches = _batched(pending)
+        ids = [[doc_id for _doc_type, doc_id in batch] for batch in batches]
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                self._store_batches(
+                    ids, pool.map(self._generate_for_refs, batches), self.backend.model_name
+                )
+        else:
+            self._store_batches(
+                ids, map(self._generate_for_refs, batches), self.backend.model_name
+            )
+        return len(pending)
+
+    async def aembed_all(
+        self,
+        backend: AsyncEmbeddingBackend | None = None,
+        concurrency: int = 8,
+    ) -> int:
+        """Embed all pending documents, dispatching batches concurrently.
+
+        Batches go through ``backend`` when given, otherwise through the
+        sync backend on worker threads. At most ``concurrency`` batches are
+        in flight at once, and each is read from the vault when it starts.
         Returns the number of documents embedded.
         """
-        docs = mkb.query_all(self.vault_path)
-        count = 0
-        for doc in docs:
-            doc_id = doc["id"]
-            if not mkb.has_embedding(self.vault_path, doc_id):
-                self.embed_document(doc_id)
-                count += 1
-        return count
+        pending = mkb.unembedded_documents(self.vault_path)
+        batches = _batched(pending)
+        ids = [[doc_id for _doc_type, doc_id in batch] for batch in batches]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(batch: list[tuple[str, str]]) -> list[list[float]]:
+            async with semaphore:
+                docs = await asyncio.to_thread(mkb.read_documents, self.vault_path, batch)
+                texts = [_document_to_text(doc) for doc in docs]
+                if backend is not None:
+                    return await backend.agenerate_batch(texts)
+                return await asyncio.to_thread(self.backend.generate_batch, texts)
+
+        # gather() returns results in submission order, so batches line up.
+        results = await asyncio.gather(*(run(batch) for batch in batches))
+        model = backend.model_name if backend is not None else self.backend.model_name
+        self._store_batches(ids, results, model)
+        return len(pending)
+
+    def _generate_batch(self, batch: list[str]) -> list[list[float]]:
+        """Read a batch of documents and generate their embeddings."""
+        return self.backend.generate_batch([self._document_text(doc_id) for doc_id in batch])
+
+    def _generate_for_refs(self, batch: list[tuple[str, str]]) -> list[list[float]]:
+        """Read a batch of ``(doc_type, id)`` documents in one call and embed them."""
+        docs = mkb.read_documents(self.vault_path, batch)
+        return self.backend.generate_batch([_document_to_text(doc) for doc in docs])
+
+    def _store_batches(
+        self,
+        batches: list[list[str]],
+        embeddings: Iterable[list[list[float]]],
+        model: str,
+    ) -> None:
+        """Store each batch of embeddings in one index transaction."""
+        for batch, batch_embeddings in zip(batches, embeddings, strict=True):
+            mkb.store_embeddings_batch(
+                self.vault_path, list(zip(batch, batch_embeddings, strict=True)), model
+            )
+
+    def _document_text(self, doc_id: str) -> str:
+        """Read a document from the vault and render it for embedding."""
+        doc = mkb.read_document(
+            self.vault_path,
+            _doc_type_from_id(doc_id),
+            doc_id,
+        )
+        return _document_to_text(doc)
 
     def search(self, query: str, limit: int = 10) -> list[dict[str, object]]:
         """Semantic search: embed the query and find similar documents."""
-        query_embedding = self.backend.generate(query)
+        query_embedding = embed_query(query, self.backend)
         results: list[dict[str, object]] = mkb.search_semantic(
             self.vault_path, query_embedding, limit=limit
         )
         return results
 
 
+def _batched(items: list[_T]) -> list[list[_T]]:
+    """Split items into backend batches of ``EMBEDDING_BATCH_SIZE``."""
+    return [
+        items[start : start + EMBEDDING_BATCH_SIZE]
+        for start in range(0, len(items), EMBEDDING_BATCH_SIZE)
+    ]
+
+
+def _longest_first(texts: list[str]) -> list[int]:
+    """Return indices of ``texts`` ordered by length, longest first."""
+    return sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True)
+
+
+def _restore_order(order: list[int], embeddings: list[list[float]]) -> list[list[float]]:
+    """Scatter embeddings computed in ``order`` back to input positions."""
+    restored: list[list[float]] = [[] for _ in order]
+    for pos, i in enumerate(order):
+        restored[i] = embeddings[pos]
+    return restored
+
+
+def _mock_vector(text: str, out: np.ndarray) -> np.ndarray:
+    """Fill ``out`` in place with the unit-length mock vector for ``text``.
+
+    Dimension ``i`` is the first four bytes of ``sha256(f"{text}-{i}")`` read
+    as a little-endian float32, scaled by 1e38 and clamped to [-1, 1], with
+    NaN mapped to 1.0. Only the hashing runs per dimension.
+    """
+    raw = b"".join(
+        hashlib.sha256(f"{text}-{i}".encode()).digest()[:4] for i in range(len(out))
+    )
+    with np.errstate(invalid="ignore"):  # NaN bit patterns
+        vec = np.frombuffer(raw, dtype="<f4").astype(np.float64) / 1e38
+    vec = np.clip(np.nan_to_num(vec, nan=1.0, posinf=1.0, neginf=-1.0), -1.0, 1.0)
+    out[:] = vec / (np.linalg.norm(vec) or 1.0)
+    return out
+
+
 def _document_to_text(doc: dict[str, object]) -> str:
     """Convert a document dict to text for embedding generation."""
-    parts: list[str] = []
     title = doc.get("title", "")
-    if title:
-        parts.append(f"Title: {title}")
     body = doc.get("body", "")
-    if body:
-        parts.append(str(body))
     tags = doc.get("tags", [])
-    if tags:
-        parts.append(f"Tags: {', '.join(str(t) for t in tags)}")  # type: ignore[attr-defined]
-    return "\n".join(parts)
+    parts = (
+        f"Title: {title}" if title else "",
+        str(body) if body else "",
+        f"Tags: {', '.join(map(str, tags))}" if tags else "",  # type: ignore[call-overload]
+    )
+    return "\n".join(filter(None, parts))
 
 
 def _doc_type_from_id(doc_id: str) -> str:
@@ -174,6 +383,33 @@ def embed_document(vault_path: str, doc_id: str, backend: EmbeddingBackend | Non
 
 
 def embed_query(query: str, backend: EmbeddingBackend | None = None) -> list[float]:
-    """Convenience function to embed a query string."""
-    b = backend or MockEmbeddingBackend()
-    return b.generate(query)
+    """Convenience function to embed a query string.
+
+    Backends opt into caching with a ``cache_key`` attribute, equal for
+    backends that return the same vectors. Repeated queries then skip the
+    backend call across backend instances; backends without one are always
+    called. The cache holds vectors only, never the backends themselves.
+    """
+    backend = backend or MockEmbeddingBackend()
+    cache_key = getattr(backend, "cache_key", None)
+    if cache_key is None:
+        return backend.generate(query)
+    key = (cache_key, query)
+    with _query_cache_lock:
+        cached = _query_cache.get(key)
+        if cached is not None:
+            _query_cache.move_to_end(key)
+            return list(cached)
+    # Kept as a tuple so cached vectors cannot be mutated
+    embedding = tuple(backend.generate(query))
+    with _query_cache_lock:
+        _query_cache[key] = embedding
+        if len(_query_cache) > _QUERY_CACHE_SIZE:
+            _query_cache.popitem(last=False)
+    return list(embedding)
+
+
+def clear_query_cache() -> None:
+    """Drop every query embedding cached by ``embed_query``."""
+    with _query_cache_lock:
+        _query_cache.clear()
@@ -6,12 +6,18 @@ Handles ISO dates, common date formats, and relative date references.
 
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
 
+from mkb_ai.extraction.engine import lazy_pattern
 
-@dataclass
+if TYPE_CHECKING:
+    import re
+    from collections.abc import Callable, Iterator
+
+
+@dataclass(slots=True)
 class ExtractedDate:
     """A date found in text with its source context."""
 
@@ -22,31 +28,38 @@ class ExtractedDate:
     is_relative: bool = False
 
 
-# ISO 8601 patterns
-_ISO_DATETIME = re.compile(
-    r"\b(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?)\b"
-)
-_ISO_DATE = re.compile(r"\b(\d{4}-\d{2}-\d{2})\b")
-
-# Common date formats
-_SLASH_DATE_MDY = re.compile(r"\b(\d{1,2}/\d{1,2}/\d{4})\b")
-_WRITTEN_DATE = re.compile(
-    r"\b((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*"
-    r"\s+\d{1,2},?\s+\d{4})\b",
-    re.IGNORECASE,
+# All date forms in one alternation, so extraction is a single scan.
+# Alternatives are tried in order at each position (ISO datetime before
+# ISO date); the group name of a match says which form it is. A date that
+# overlaps one already found, like the ISO date in "Mar 3, 2025-02-10", is
+# not reported.
+_date_pattern = lazy_pattern(
+    # ISO 8601
+    r"\b(?P<iso_datetime>\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?"
+    r"(?:Z|[+-]\d{2}:?\d{2})?)\b"
+    r"|\b(?P<iso_date>\d{4}-\d{2}-\d{2})\b"
+    # Common date formats
+    r"|\b(?P<written>(?P<w_month>(?i:(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*))"
+    r"\s+(?P<w_day>\d{1,2}),?\s+(?P<w_year>\d{4}))\b"
+    r"|\b(?P<slash>\d{1,2}/\d{1,2}/\d{4})\b"
+    # Relative references
+    r"|(?i:\b(?P<yesterday>yesterday)\b"
+    r"|\b(?P<today>today)\b"
+    r"|\b(?P<tomorrow>tomorrow)\b"
+    r"|\b(?P<last_week>last\s+week)\b"
+    r"|\b(?P<next_week>next\s+week)\b"
+    r"|\b(?P<last_month>last\s+month)\b"
+    r"|\b(?P<n_days_ago>(?P<days>\d+)\s+days?\s+ago)\b"
+    r"|\b(?P<n_weeks_ago>(?P<weeks>\d+)\s+weeks?\s+ago)\b)"
 )
 
-# Relative references
-_RELATIVE_PATTERNS: list[tuple[re.Pattern[str], str]] = [
-    (re.compile(r"\byesterday\b", re.IGNORECASE), "yesterday"),
-    (re.compile(r"\btoday\b", re.IGNORECASE), "today"),
-    (re.compile(r"\btomorrow\b", re.IGNORECASE), "tomorrow"),
-    (re.compile(r"\blast\s+week\b", re.IGNORECASE), "last_week"),
-    (re.compile(r"\bnext\s+week\b", re.IGNORECASE), "next_week"),
-    (re.compile(r"\blast\s+month\b", re.IGNORECASE), "last_month"),
-    (re.compile(r"\b(\d+)\s+days?\s+ago\b", re.IGNORECASE), "n_days_ago"),
-    (re.compile(r"\b(\d+)\s+weeks?\s+ago\b", re.IGNORECASE), "n_weeks_ago"),
-]
+# Length of the YYYY-MM-DD date that starts every ISO datetime
+_ISO_DATE_LENGTH = 10
+
+# Every date form contains a digit except the relative references, which
+# all contain one of these words; text with neither cannot match.
+_digit = lazy_pattern(r"\d")
+_RELATIVE_KEYWORDS = ("yesterday", "today", "tomorrow", "last", "next")
 
 _MONTH_NAMES = {
     "jan": 1, "january": 1,
@@ -64,7 +77,7 @@ _MONTH_NAMES = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class DateExtractor:
     """Extract dates and time references from text.
 
@@ -76,82 +89,55 @@ class DateExtractor:
     )
 
     def extract(self, text: str) -> list[ExtractedDate]:
-        """Extract all date references from text."""
-        results: list[ExtractedDate] = []
-
-        # ISO datetime (most specific first)
-        for m in _ISO_DATETIME.finditer(text):
-            dt = _parse_iso_datetime(m.group(1))
-            if dt is not None:
-                results.append(
-                    ExtractedDate(
-                        value=dt,
-                        original_text=m.group(0),
-                        start=m.start(),
-                        end=m.end(),
-                    )
-                )
-
-        # ISO date only (skip if already matched as datetime)
-        seen_ranges = {(r.start, r.end) for r in results}
-        for m in _ISO_DATE.finditer(text):
-            if any(s <= m.start() and m.end() <= e for s, e in seen_ranges):
+        """Extract all date references from text, in order of position."""
+        return [
+            ExtractedDate(
+                value=dt,
+                original_text=text[start:end],
+                start=start,
+                end=end,
+                is_relative=is_relative,
+            )
+            for start, end, dt, is_relative in self._resolved_matches(text)
+        ]
+
+    def count(self, text: str) -> int:
+        """Count the date references ``extract`` would return, without building them."""
+        return sum(1 for _ in self._resolved_matches(text))
+
+    def _resolved_matches(
+        self, text: str
+    ) -> Iterator[tuple[int, int, datetime, bool]]:
+        """Yield the span, value and relativity of each valid date match."""
+        if not _may_contain_date(text):
+            return
+        pattern = _date_pattern()
+        pos = 0
+        while (m := pattern.search(text, pos)) is not None:
+            kind = m.lastgroup
+            start, end = m.span()
+            if kind is None:
+                pos = end
                 continue
-            dt = _parse_iso_date(m.group(1))
-            if dt is not None:
-                results.append(
-                    ExtractedDate(
-                        value=dt,
-                        original_text=m.group(0),
-                        start=m.start(),
-                        end=m.end(),
-                    )
-                )
-
-        # Written dates (e.g., "January 15, 2025")
-        for m in _WRITTEN_DATE.finditer(text):
-            dt = _parse_written_date(m.group(1))
-            if dt is not None:
-                results.append(
-                    ExtractedDate(
-                        value=dt,
-                        original_text=m.group(0),
-                        start=m.start(),
-                        end=m.end(),
-                    )
-                )
-
-        # Slash dates (M/D/YYYY)
-        for m in _SLASH_DATE_MDY.finditer(text):
-            dt = _parse_slash_date(m.group(1))
-            if dt is not None:
-                results.append(
-                    ExtractedDate(
-                        value=dt,
-                        original_text=m.group(0),
-                        start=m.start(),
-                        end=m.end(),
-                    )
-                )
-
-        # Relative dates
-        for pattern, kind in _RELATIVE_PATTERNS:
-            for m in pattern.finditer(text):
+            parser = _ABSOLUTE_PARSERS.get(kind)
+            if parser is not None:
+                dt = parser(m)
+                is_relative = False
+                if dt is None and kind == "iso_datetime":
+                    # Fall back to the date part, as in "2025-02-10 24:00:00"
+                    dt = _parse_iso_date_prefix(m)
+                    end = start + _ISO_DATE_LENGTH
+            else:
                 dt = self._resolve_relative(kind, m)
-                if dt is not None:
-                    results.append(
-                        ExtractedDate(
-                            value=dt,
-                            original_text=m.group(0),
-                            start=m.start(),
-                            end=m.end(),
-                            is_relative=True,
-                        )
-                    )
-
-        # Sort by position in text
-        results.sort(key=lambda r: r.start)
-        return results
+                is_relative = True
+            if dt is None:
+                # The failed match consumed its text; rescan from the next
+                # position so a date inside it, as in "Feb 30, 2025-02-10",
+                # is still found
+                pos = start + 1
+                continue
+            yield start, end, dt, is_relative
+            pos = end
 
     def _resolve_relative(
         self, kind: str, match: re.Match[str]
@@ -173,50 +159,69 @@ class DateExtractor:
                 year=ref.year if ref.month > 1 else ref.year - 1,
             )
         if kind == "n_days_ago":
-            n = int(match.group(1))
+            n = int(match.group("days"))
             return ref - timedelta(days=n)
         if kind == "n_weeks_ago":
-            n = int(match.group(1))
+            n = int(match.group("weeks"))
             return ref - timedelta(weeks=n)
         return None
 
 
-def _parse_iso_datetime(s: str) -> datetime | None:
+def _may_contain_date(text: str) -> bool:
+    """Cheap pre-check that skips the full scan for date-free text."""
+    if _digit().search(text):
+        return True
+    folded = text.casefold()
+    return any(word in folded for word in _RELATIVE_KEYWORDS)
+
+
+def _parse_iso_datetime(match: re.Match[str]) -> datetime | None:
     """Parse an ISO 8601 datetime string."""
     try:
-        return datetime.fromisoformat(s.replace("Z", "+00:00"))
+        return datetime.fromisoformat(match.group("iso_datetime").replace("Z", "+00:00"))
     except ValueError:
         return None
 
 
-def _parse_iso_date(s: str) -> datetime | None:
+def _parse_iso_date(match: re.Match[str]) -> datetime | None:
     """Parse an ISO 8601 date-only string."""
     try:
-        return datetime.fromisoformat(s).replace(tzinfo=UTC)
+        return datetime.fromisoformat(match.group("iso_date")).replace(tzinfo=UTC)
     except ValueError:
         return None
 
 
-def _parse_written_date(s: str) -> datetime | None:
-    """Parse a written date like 'January 15, 2025'."""
-    parts = re.split(r"[\s,]+", s.strip())
-    if len(parts) < 3:
+def _parse_iso_date_prefix(match: re.Match[str]) -> datetime | None:
+    """Parse the date part of an unparseable ISO datetime on its own.
+
+    Only a space-separated date stands alone; before ``T`` there is no
+    word boundary for an ISO date to end at.
+    """
+    value = match.group("iso_datetime")
+    if value[_ISO_DATE_LENGTH] != " ":
         return None
-    month_str = parts[0].lower()
-    month = _MONTH_NAMES.get(month_str)
+    try:
+        return datetime.fromisoformat(value[:_ISO_DATE_LENGTH]).replace(tzinfo=UTC)
+    except ValueError:
+        return None
+
+
+def _parse_written_date(match: re.Match[str]) -> datetime | None:
+    """Parse a written date like 'January 15, 2025' from its captured parts."""
+    month = _MONTH_NAMES.get(match.group("w_month").lower())
     if month is None:
         return None
     try:
-        day = int(parts[1])
-        year = int(parts[2])
-        return datetime(year, month, day, tzinfo=UTC)
-    except (ValueError, IndexError):
+        return datetime(
+            int(match.group("w_year")), month, int(match.group("w_day")), tzinfo=UTC
+        )
+    except ValueError:
         return None
 
 
-def _parse_slash_date(s: str) -> datetime | None:
+def _parse_slash_date(match: re.Match[str]) -> datetime | None:
     """Parse M/D/YYYY format."""
-    parts = s.split("/")
+    parts = match.group("slash").split("/")
     if len(parts) != 3:
         return None
     try:
@@ -224,3 +229,13 @@ def _parse_slash_date(s: str) -> datetime | None:
         return datetime(year, month, day, tzinfo=UTC)
     except ValueError:
         return None
+
+
+# Parsers for the absolute date groups of _date_pattern; every other group
+# is a relative reference resolved against DateExtractor.reference_time.
+_ABSOLUTE_PARSERS: dict[str, Callable[[re.Match[str]], datetime | None]] = {
+    "iso_datetime": _parse_iso_datetime,
+    "iso_date": _parse_iso_date,
+    "written": _parse_written_date,
+    "slash": _parse_slash_date,
+}
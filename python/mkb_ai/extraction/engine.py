@@ -0,0 +1,46 @@
+"""Regex engine selection for the rule-based extractors.
+
+Patterns are compiled with google-re2 (linear-time automaton, no
+backtracking) when it is installed, and with the standard library ``re``
+module otherwise. Extractor patterns avoid backreferences and lookaround
+so they compile under both engines, and write flags inline (``(?i)``)
+because re2 does not accept ``re`` flag arguments.
+
+Under re2, ``\\w``, ``\\d`` and ``\\b`` match ASCII only, so mentions with
+non-ASCII letters are cut short at the first such character.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from typing import TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+
+def compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a pattern with re2 when available, else with ``re``.
+
+    Falls back to ``re`` for any pattern re2 rejects.
+    """
+    if re2 is not None:
+        try:
+            return cast("re.Pattern[str]", re2.compile(pattern))
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+
+def lazy_pattern(pattern: str) -> Callable[[], re.Pattern[str]]:
+    """Return a getter that compiles ``pattern`` on first call and caches it.
+
+    Keeps regex compilation out of import time, which every CLI run pays.
+    """
+    return functools.cache(lambda: compile_pattern(pattern))
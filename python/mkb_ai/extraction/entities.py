@@ -6,11 +6,25 @@ Extracts Jira ticket IDs, person mentions, URLs, and email addresses.
 
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
+from mkb_ai.extraction.engine import lazy_pattern
 
-@dataclass
+try:
+    from mkb import entity_scan as _entity_scan
+except ImportError:
+    _entity_scan = None
+
+if TYPE_CHECKING:
+    import re
+    from collections.abc import Callable, Iterable
+
+    # (kind, a substring every match contains, pattern, value group)
+    _KindPattern = tuple[str, str, Callable[[], re.Pattern[str]], int]
+
+
+@dataclass(slots=True)
 class ExtractedEntity:
     """An entity found in text."""
 
@@ -22,99 +36,92 @@ class ExtractedEntity:
 
 
 # Jira ticket pattern: PROJECT-123
-_JIRA_TICKET = re.compile(r"\b([A-Z][A-Z0-9]+-\d+)\b")
+_jira_ticket = lazy_pattern(r"\b([A-Z][A-Z0-9]+-\d+)\b")
 
 # Person mention: @name or Name (Title)
-_AT_MENTION = re.compile(r"@(\w[\w.-]*\w|\w)")
-_PERSON_TITLE = re.compile(
+_at_mention = lazy_pattern(r"@(\w[\w.-]*\w|\w)")
+_person_title = lazy_pattern(
     r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\s*\("
     r"(?:CEO|CTO|VP|Director|Manager|Lead|Engineer|PM|Designer|Analyst)"
     r"\)"
 )
 
 # URL pattern (simplified)
-_URL = re.compile(
-    r"https?://[^\s<>\"')\]]+",
-    re.IGNORECASE,
-)
+_url = lazy_pattern(r"(?i)https?://[^\s<>\"')\]]+")
 
 # Email pattern
-_EMAIL = re.compile(
+_email = lazy_pattern(
     r"\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b"
 )
 
 
-@dataclass
+# Patterns in extraction order. Kinds are scanned separately because their
+# matches may overlap, as with the "@example.com" mention inside
+# "alice@example.com", which a single alternation would drop. The native
+# ``entity_scan`` compiles the same patterns, in this order, with Rust's
+# regex crate and refers to them by index.
+_KIND_PATTERNS: tuple[_KindPattern, ...] = (
+    ("jira_ticket", "-", _jira_ticket, 1),
+    ("person", "@", _at_mention, 1),
+    ("person", "(", _person_title, 1),
+    ("url", "://", _url, 0),
+    ("email", "@", _email, 0),
+)
+
+
+@dataclass(slots=True)
 class EntityExtractor:
     """Extract named entities from text using regex patterns."""
 
     def extract(self, text: str) -> list[ExtractedEntity]:
-        """Extract all entities from text."""
-        results: list[ExtractedEntity] = []
+        """Extract all entities from text.
 
-        # Jira tickets
-        for m in _JIRA_TICKET.finditer(text):
-            results.append(
-                ExtractedEntity(
-                    kind="jira_ticket",
-                    value=m.group(1),
-                    original_text=m.group(0),
-                    start=m.start(),
-                    end=m.end(),
-                )
-            )
+        Uses the native scanner when the bridge provides it. Otherwise each
+        pattern is skipped when a substring it requires (``-``, ``@``, ``(``
+        or ``://``) is absent, which is far cheaper than a scan.
+        """
+        return _scan(text, range(len(_KIND_PATTERNS)))
 
-        # @mentions
-        for m in _AT_MENTION.finditer(text):
-            results.append(
-                ExtractedEntity(
-                    kind="person",
-                    value=m.group(1),
-                    original_text=m.group(0),
-                    start=m.start(),
-                    end=m.end(),
-                )
-            )
-
-        # Person with title
-        for m in _PERSON_TITLE.finditer(text):
-            results.append(
-                ExtractedEntity(
-                    kind="person",
-                    value=m.group(1),
-                    original_text=m.group(0),
-                    start=m.start(),
-                    end=m.end(),
-                )
-            )
-
-        # URLs
-        for m in _URL.finditer(text):
-            results.append(
-                ExtractedEntity(
-                    kind="url",
-                    value=m.group(0),
-                    original_text=m.group(0),
-                    start=m.start(),
-                    end=m.end(),
-                )
-            )
-
-        # Emails
-        for m in _EMAIL.finditer(text):
+    def extract_by_kind(self, text: str, kind: str) -> list[ExtractedEntity]:
+        """Extract entities of a specific kind, running only its patterns."""
+        return _scan(
+            text, [i for i, p in enumerate(_KIND_PATTERNS) if p[0] == kind]
+        )
+
+
+def _scan(text: str, indices: Iterable[int]) -> list[ExtractedEntity]:
+    """Run the kind patterns at indices over text, returning matches by position."""
+    if _entity_scan is not None:
+        return _scan_native(text, list(indices))
+    results: list[ExtractedEntity] = []
+    for kind, required, pattern, group in (_KIND_PATTERNS[i] for i in indices):
+        if required not in text:
+            continue
+        for m in pattern().finditer(text):
             results.append(
                 ExtractedEntity(
-                    kind="email",
-                    value=m.group(0),
+                    kind=kind,
+                    value=m.group(group),
                     original_text=m.group(0),
                     start=m.start(),
                     end=m.end(),
                 )
             )
-
-        results.sort(key=lambda r: r.start)
-        return results
-
-    def extract_by_kind(self, text: str, kind: str) -> list[ExtractedEntity]:
-        """Extract entities of a specific kind."""
-        return [e for e in self.extract(text) if e.kind == kind]
+    results.sort(key=lambda r: r.start)
+    return results
+
+
+def _scan_native(text: str, indices: list[int]) -> list[ExtractedEntity]:
+    """Build entities from the character offsets ``entity_scan`` reports."""
+    results = [
+        ExtractedEntity(
+            kind=_KIND_PATTERNS[idx][0],
+            value=text[value_start:value_end],
+            original_text=text[start:end],
+            start=start,
+            end=end,
+        )
+        for idx, value_start, value_end, start, end in _entity_scan(text, indices)
+    ]
+    results.sort(key=lambda r: r.start)
+    return results
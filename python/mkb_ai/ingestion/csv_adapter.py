@@ -8,27 +8,42 @@ columns, and observed_at from detected/specified date columns.
 from __future__ import annotations
 
 import csv
+import functools
 import re
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from itertools import chain, islice
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Iterator, Sequence
 
 import mkb
 
-from mkb_ai.ingestion.pipeline import IngestResult
+from mkb_ai.ingestion.pipeline import CREATE_BATCH_SIZE, IngestResult
+
+_MONTH_NUMBERS = {
+    "january": 1,
+    "february": 2,
+    "march": 3,
+    "april": 4,
+    "may": 5,
+    "june": 6,
+    "july": 7,
+    "august": 8,
+    "september": 9,
+    "october": 10,
+    "november": 11,
+    "december": 12,
+}
+
+# Rows buffered from the top of the file when sampling for a date column
+_DATE_SAMPLE_ROWS = 5
 
-# Patterns for detecting date-like values in cells
-_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}:\d{2})?")
-_SLASH_DATE_RE = re.compile(r"^\d{1,2}/\d{1,2}/\d{4}$")
-_WRITTEN_DATE_RE = re.compile(
-    r"^(?:January|February|March|April|May|June|July|August|September|October|November|December)"
-    r"\s+\d{1,2},?\s+\d{4}$",
-    re.IGNORECASE,
-)
+# Read buffer for CSV files; larger than the 8 KiB default so big exports
+# are read in few system calls
+_READ_BUFFER_SIZE = 1 << 20
 
 # Column names that hint at date content
 _DATE_COLUMN_HINTS = {
@@ -74,26 +89,36 @@ class CsvAdapter:
     def ingest_csv(self, csv_path: str | Path) -> list[IngestResult]:
         """Ingest all rows from a CSV file as documents.
 
-        Returns a list of IngestResult, one per row.
+        Rows are streamed from the reader; only the first few are buffered
+        to sample for a date column. Returns a list of IngestResult, one
+        per row.
         """
         path = Path(csv_path)
-        with path.open(newline="") as f:
-            reader = csv.DictReader(f)
-            headers = reader.fieldnames or []
-            rows = list(reader)
-
-        if not rows or not headers:
-            return []
-
-        # Resolve column mapping
-        title_col = self._resolve_title_column(headers)
-        date_col = self._resolve_date_column(headers, rows)
-        body_cols = self._resolve_body_columns(headers, title_col, date_col)
-
-        results: list[IngestResult] = []
-        for row in rows:
-            result = self._ingest_row(row, title_col, date_col, body_cols)
-            results.append(result)
+        with path.open(newline="", buffering=_READ_BUFFER_SIZE) as f:
+            reader = csv.reader(f)
+            headers = next(reader, [])
+            sample = list(islice(_nonblank(reader), _DATE_SAMPLE_ROWS))
+
+            if not sample or not headers:
+                return []
+
+            # Resolve column mapping to indices once
+            title_col = self._resolve_title_column(headers)
+            date_col = self._resolve_date_column(headers, sample)
+            body_cols = self._resolve_body_columns(headers, title_col, date_col)
+
+            title_idx = _column_index(headers, title_col)
+            date_idx = _column_index(headers, date_col)
+            body_idxs = [(col, _column_index(headers, col)) for col in body_cols]
+
+            results: list[IngestResult] = []
+            pending: list[dict[str, str]] = []
+            for row in chain(sample, _nonblank(reader)):
+                pending.append(self._row_to_document(row, title_idx, date_idx, body_idxs))
+                if len(pending) >= CREATE_BATCH_SIZE:
+                    results.extend(self._create_documents(pending))
+                    pending = []
+            results.extend(self._create_documents(pending))
 
         return results
 
@@ -108,7 +133,7 @@ class CsvAdapter:
         return headers[0]
 
     def _resolve_date_column(
-        self, headers: Sequence[str], rows: list[dict[str, str]]
+        self, headers: Sequence[str], sample: list[list[str]]
     ) -> str | None:
         """Detect which column contains dates."""
         if self.mapping and self.mapping.date_column:
@@ -119,10 +144,9 @@ class CsvAdapter:
             if h.lower() in _DATE_COLUMN_HINTS:
                 return h
 
-        # Strategy 2: sample cell values from first few rows
-        sample = rows[:5]
-        for h in headers:
-            date_count = sum(1 for r in sample if _looks_like_date(r.get(h, "")))
+        # Strategy 2: sample cell values from the buffered rows
+        for i, h in enumerate(headers):
+            date_count = sum(1 for r in sample if _looks_like_date(_cell(r, i)))
             if date_count > 0 and date_count >= len(sample) * 0.5:
                 return h
 
@@ -143,57 +167,92 @@ class CsvAdapter:
             excluded.add(date_col)
         return [h for h in headers if h not in excluded]
 
-    def _ingest_row(
+    def _row_to_document(
         self,
-        row: dict[str, str],
-        title_col: str,
-        date_col: str | None,
-        body_cols: list[str],
-    ) -> IngestResult:
-        """Convert a single CSV row into a document."""
-        title = row.get(title_col, "Untitled").strip() or "Untitled"
+        row: list[str],
+        title_idx: int | None,
+        date_idx: int | None,
+        body_idxs: list[tuple[str, int | None]],
+    ) -> dict[str, str]:
+        """Convert a single CSV row into create_document arguments."""
+        title = _cell(row, title_idx).strip() or "Untitled"
 
         # Extract observed_at
-        obs_at: str
-        if date_col and row.get(date_col, "").strip():
-            obs_at = _normalize_date(row[date_col].strip())
-        else:
-            obs_at = datetime.now(UTC).isoformat()
+        date_val = _cell(row, date_idx).strip()
+        obs_at = _normalize_date(date_val) if date_val else datetime.now(UTC).isoformat()
 
         # Build body from remaining columns
         body_parts: list[str] = []
-        for col in body_cols:
-            val = row.get(col, "").strip()
+        for col, idx in body_idxs:
+            val = _cell(row, idx).strip()
             if val:
                 body_parts.append(f"**{col}**: {val}")
         body = "\n\n".join(body_parts) if body_parts else ""
 
-        doc = mkb.create_document(
-            self.vault_path,
-            self.doc_type,
-            title,
-            obs_at,
-            body=body,
-        )
+        return {
+            "doc_type": self.doc_type,
+            "title": title,
+            "observed_at": obs_at,
+            "body": body,
+        }
+
+    def _create_documents(self, docs: list[dict[str, str]]) -> list[IngestResult]:
+        """Create a batch of documents in one bridge call."""
+        if not docs:
+            return []
+        created = mkb.create_documents_batch(self.vault_path, docs)
+        return [
+            IngestResult(
+                doc_id=doc["id"],
+                title=spec["title"],
+                observed_at=spec["observed_at"],
+                confidence=0.8,  # Import source default
+            )
+            for spec, doc in zip(docs, created, strict=True)
+        ]
+
+
+def _column_index(headers: Sequence[str], column: str | None) -> int | None:
+    """Position of a column in the header row, or None when absent."""
+    if column is None or column not in headers:
+        return None
+    return headers.index(column)
+
+
+def _cell(row: Sequence[str], idx: int | None) -> str:
+    """Cell value at idx, or "" for an absent column or a short row."""
+    if idx is None or idx >= len(row):
+        return ""
+    return row[idx]
+
+
+def _nonblank(rows: Iterable[list[str]]) -> Iterator[list[str]]:
+    """Skip empty lines, as csv.DictReader does."""
+    return (row for row in rows if row)
+
+
+@functools.cache
+def _date_cell_pattern() -> re.Pattern[str]:
+    """One anchored pattern for every date-like cell format.
 
-        return IngestResult(
-            doc_id=doc["id"],
-            title=title,
-            observed_at=obs_at,
-            confidence=0.8,  # Import source default
-        )
+    The matching group name (iso, slash or written) tells _normalize_date
+    how to convert it. Compiled on first use, so importing the adapter
+    does not pay for it.
+    """
+    return re.compile(
+        r"^(?:"
+        r"(?P<iso>\d{4}-\d{2}-\d{2}(?:T\d{2}:\d{2}:\d{2})?)"
+        r"|(?P<slash>(?P<s_month>\d{1,2})/(?P<s_day>\d{1,2})/(?P<s_year>\d{4}))$"
+        r"|(?P<written>(?P<w_month>(?i:January|February|March|April|May|June|July|August"
+        r"|September|October|November|December))"
+        r"\s+(?P<w_day>\d{1,2}),?\s+(?P<w_year>\d{4}))$"
+        r")"
+    )
 
 
 def _looks_like_date(value: str) -> bool:
     """Check if a string value looks like a date."""
-    v = value.strip()
-    if not v:
-        return False
-    return bool(
-        _ISO_DATE_RE.match(v)
-        or _SLASH_DATE_RE.match(v)
-        or _WRITTEN_DATE_RE.match(v)
-    )
+    return _date_cell_pattern().match(value.strip()) is not None
 
 
 def _normalize_date(value: str) -> str:
@@ -204,31 +263,23 @@ def _normalize_date(value: str) -> str:
     core requires a full datetime for observed_at.
     """
     v = value.strip()
-
-    # Already full ISO datetime
-    if _ISO_DATE_RE.match(v) and "T" in v:
+    m = _date_cell_pattern().match(v)
+    if m is None:
         return v
 
-    # ISO date only (YYYY-MM-DD) — append time
-    if _ISO_DATE_RE.match(v):
-        return f"{v}T00:00:00Z"
+    kind = m.lastgroup
+    if kind == "iso":
+        # Already a full ISO datetime, or date only — append time
+        return v if "T" in v else f"{v}T00:00:00Z"
 
-    # Slash date: M/D/YYYY
-    if _SLASH_DATE_RE.match(v):
-        parts = v.split("/")
-        try:
-            month, day, year = int(parts[0]), int(parts[1]), int(parts[2])
-            return f"{year:04d}-{month:02d}-{day:02d}T00:00:00Z"
-        except (ValueError, IndexError):
-            return v
+    if kind == "slash":
+        month, day, year = (int(g) for g in m.group("s_month", "s_day", "s_year"))
+        return f"{year:04d}-{month:02d}-{day:02d}T00:00:00Z"
 
     # Written date: March 5, 2025
-    if _WRITTEN_DATE_RE.match(v):
-        for fmt in ("%B %d, %Y", "%B %d %Y"):
-            try:
-                dt = datetime.strptime(v, fmt)  # noqa: DTZ007
-                return dt.strftime("%Y-%m-%dT00:00:00Z")
-            except ValueError:
-                continue
-
-    return v
+    month = _MONTH_NUMBERS[m.group("w_month").lower()]
+    try:
+        dt = datetime(int(m.group("w_year")), month, int(m.group("w_day")), tzinfo=UTC)
+    except ValueError:
+        return v
+    return dt.strftime("%Y-%m-%dT00:00:00Z")
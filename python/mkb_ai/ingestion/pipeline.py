@@ -9,19 +9,51 @@ Processes raw text/files into MKB documents with:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import fnmatch
+import functools
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import mkb
 
 from mkb_ai.confidence.scorer import ConfidenceScorer
-from mkb_ai.embeddings.generator import EmbeddingBackend, EmbeddingGenerator
-from mkb_ai.extraction.dates import DateExtractor
+from mkb_ai.extraction.dates import DateExtractor, ExtractedDate
 from mkb_ai.extraction.entities import EntityExtractor, ExtractedEntity
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
-@dataclass
+    from mkb_ai.embeddings.generator import EmbeddingBackend, EmbeddingGenerator
+
+# Documents created per create_documents_batch call (one index transaction each)
+CREATE_BATCH_SIZE = 1000
+
+# Sections of a dry run preview, in the order they appear in it
+DRY_RUN_SECTIONS = ("title", "dates", "entities", "tags", "confidence")
+
+# A "# " heading line with visible text, and the first visible text of any
+# line. Lines end at "\n"; a trailing "\r" is stripped from the result.
+_HEADING_RE = re.compile(r"(?m)^[^\S\n]*# (.*\S.*)$")
+_FIRST_TEXT_RE = re.compile(r"\S.*")
+
+
+@functools.cache
+def _shared_entity_extractor() -> EntityExtractor:
+    """Return the entity extractor shared by pipelines that don't supply one.
+
+    The extractor holds no state, so one instance serves every pipeline.
+    The date extractor is not shared: it resolves relative dates against
+    the time it was created.
+    """
+    return EntityExtractor()
+
+
+@dataclass(slots=True)
 class IngestResult:
     """Result of ingesting one item."""
 
@@ -34,6 +66,19 @@ class IngestResult:
     embedded: bool = False
 
 
+@dataclass(slots=True)
+class _PreparedDocument:
+    """Extraction and scoring output for one item, before it is created."""
+
+    title: str
+    observed_at: str
+    body: str
+    tags: list[str]
+    confidence: float
+    extracted_dates: int
+    extracted_entities: int
+
+
 @dataclass
 class IngestPipeline:
     """Enriched ingestion pipeline for MKB vaults.
@@ -46,9 +91,21 @@ class IngestPipeline:
     doc_type: str = "document"
     embed: bool = False
     embedding_backend: EmbeddingBackend | None = None
+    embed_batch_size: int = 32
     _date_extractor: DateExtractor = field(default_factory=DateExtractor)
-    _entity_extractor: EntityExtractor = field(default_factory=EntityExtractor)
+    _entity_extractor: EntityExtractor = field(default_factory=_shared_entity_extractor)
     _scorer: ConfidenceScorer = field(default_factory=ConfidenceScorer)
+    _embedding_generator: EmbeddingGenerator | None = field(
+        default=None, init=False, repr=False
+    )
+    # Extraction results for the most recent text, so that a dry run
+    # followed by ingesting the same text extracts only once
+    _date_memo: tuple[str, tuple[ExtractedDate, ...]] | None = field(
+        default=None, init=False, repr=False
+    )
+    _entity_memo: tuple[str, tuple[ExtractedEntity, ...]] | None = field(
+        default=None, init=False, repr=False
+    )
 
     def ingest_text(
         self,
@@ -56,143 +113,346 @@ class IngestPipeline:
         title: str | None = None,
         observed_at: str | None = None,
         source: str = "import",
+        fallback_observed_at: str | None = None,
     ) -> IngestResult:
         """Ingest raw text with AI enrichment.
 
         If observed_at is not provided, attempts to extract a date from the text.
+        When none is found, ``fallback_observed_at`` is used, or the current
+        time if that is not given either.
         """
+        result = self._create(
+            self._prepare(text, title, observed_at, source, fallback_observed_at)
+        )
+        if self.embed:
+            self._embed_results([result])
+        return result
+
+    def _prepare(
+        self,
+        text: str,
+        title: str | None,
+        observed_at: str | None,
+        source: str,
+        fallback_observed_at: str | None = None,
+    ) -> _PreparedDocument:
+        """Run extraction and scoring on text; touches neither vault nor index."""
         # Extract title from first heading if not provided
         if title is None:
             title = _extract_title(text)
 
-        # Extract dates
-        dates = self._date_extractor.extract(text)
-        extracted_dates = len(dates)
-
-        # Determine observed_at
+        # Extract dates and determine observed_at
         if observed_at is not None:
+            # Only the number of dates is reported
+            extracted_dates = self._date_count(text)
             obs_at = observed_at
-        elif dates:
-            # Use the first extracted date
-            obs_at = dates[0].value.isoformat()
         else:
-            # Fall back to now
-            obs_at = datetime.now(UTC).isoformat()
+            dates = self._dates(text)
+            extracted_dates = len(dates)
+            if dates:
+                # Use the first extracted date
+                obs_at = dates[0].value.isoformat()
+            else:
+                # Fall back to the caller's timestamp, else now
+                obs_at = fallback_observed_at or datetime.now(UTC).isoformat()
 
         # Extract entities
-        entities = self._entity_extractor.extract(text)
+        entities = self._entities(text)
         extracted_entities = len(entities)
 
-        # Build tags from entities
-        tags = _entities_to_tags(entities)
+        # Build tags from entities; every entity yields at least one tag
+        tags = _entities_to_tags(entities) if entities else []
 
         # Score confidence
-        breakdown = self._scorer.score(
+        confidence = self._scorer.score_fast(
             source=source,
             precision="day",
-            has_body=bool(text.strip()),
-            has_tags=bool(tags),
+            has_body=_has_content(text),
+            has_tags=bool(entities),
             has_links=False,
         )
 
-        # Create the document
+        return _PreparedDocument(
+            title=title,
+            observed_at=obs_at,
+            body=text,
+            tags=tags,
+            confidence=confidence,
+            extracted_dates=extracted_dates,
+            extracted_entities=extracted_entities,
+        )
+
+    def _dates(self, text: str) -> tuple[ExtractedDate, ...]:
+        """Extract dates from text, reusing the result for a repeated text."""
+        memo = self._date_memo
+        if memo is not None and memo[0] == text:
+            return memo[1]
+        dates = tuple(self._date_extractor.extract(text))
+        self._date_memo = (text, dates)
+        return dates
+
+    def _date_count(self, text: str) -> int:
+        """Count the dates in text, without building them unless already cached."""
+        memo = self._date_memo
+        if memo is not None and memo[0] == text:
+            return len(memo[1])
+        return self._date_extractor.count(text)
+
+    def _entities(self, text: str) -> tuple[ExtractedEntity, ...]:
+        """Extract entities from text, reusing the result for a repeated text."""
+        memo = self._entity_memo
+        if memo is not None and memo[0] == text:
+            return memo[1]
+        entities = tuple(self._entity_extractor.extract(text))
+        self._entity_memo = (text, entities)
+        return entities
+
+    def _create(self, prepared: _PreparedDocument) -> IngestResult:
+        """Create the document for a prepared item, without embedding it."""
         doc = mkb.create_document(
             self.vault_path,
             self.doc_type,
-            title,
-            obs_at,
-            body=text,
-            tags=tags if tags else None,
+            prepared.title,
+            prepared.observed_at,
+            body=prepared.body,
+            tags=prepared.tags if prepared.tags else None,
         )
 
-        doc_id = doc["id"]
-        embedded = False
-
-        # Optionally generate embedding
-        if self.embed:
-            gen = EmbeddingGenerator(self.vault_path, self.embedding_backend)
-            gen.embed_document(doc_id)
-            embedded = True
-
         return IngestResult(
-            doc_id=doc_id,
-            title=title,
-            observed_at=obs_at,
-            confidence=breakdown.final_score,
-            extracted_dates=extracted_dates,
-            extracted_entities=extracted_entities,
-            embedded=embedded,
+            doc_id=doc["id"],
+            title=prepared.title,
+            observed_at=prepared.observed_at,
+            confidence=prepared.confidence,
+            extracted_dates=prepared.extracted_dates,
+            extracted_entities=prepared.extracted_entities,
         )
 
     def ingest_file(self, file_path: str | Path) -> IngestResult:
         """Ingest a file with AI enrichment."""
-        path = Path(file_path)
+        result = self._create(self._prepare_file(Path(file_path)))
+        if self.embed:
+            self._embed_results([result])
+        return result
+
+    def _prepare_file(
+        self, path: Path, fallback_observed_at: str | None = None
+    ) -> _PreparedDocument:
+        """Read a file and run extraction and scoring on its text."""
         text = path.read_text()
         title = _extract_title(text) or path.stem
-        return self.ingest_text(text, title=title, source="import")
+        return self._prepare(text, title, None, "import", fallback_observed_at)
 
     def ingest_directory(
-        self, dir_path: str | Path, pattern: str = "*.md"
+        self, dir_path: str | Path, pattern: str = "*.md", workers: int = 1
     ) -> list[IngestResult]:
-        """Ingest all matching files in a directory."""
-        path = Path(dir_path)
-        results: list[IngestResult] = []
-        for file_path in sorted(path.glob(pattern)):
-            result = self.ingest_file(file_path)
-            results.append(result)
+        """Ingest all matching files in a directory.
+
+        With ``workers`` > 1, files are read and run through extraction on
+        a thread pool of that size. Documents are always created in file
+        order on the calling thread, since document IDs are allocated from
+        the files already in the vault, and up to 1000 at a time through
+        ``mkb.create_documents_batch``. When embedding is enabled,
+        documents are embedded after all files are ingested,
+        ``embed_batch_size`` per backend request.
+        """
+        files = _matching_files(Path(dir_path), pattern)
+        # Files without a date share one timestamp for the whole run
+        prepare = functools.partial(
+            self._prepare_file, fallback_observed_at=datetime.now(UTC).isoformat()
+        )
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = self._create_all(pool.map(prepare, files))
+        else:
+            results = self._create_all(map(prepare, files))
+        if self.embed:
+            self._embed_results(results)
         return results
 
-    def dry_run(self, text: str, title: str | None = None) -> dict[str, object]:
-        """Preview what would be extracted without creating a document."""
-        if title is None:
-            title = _extract_title(text)
+    def ingest_directory_parallel(
+        self, dir_path: str | Path, pattern: str = "*.md", workers: int | None = None
+    ) -> list[IngestResult]:
+        """Ingest all matching files, running extraction on a process pool.
 
-        dates = self._date_extractor.extract(text)
-        entities = self._entity_extractor.extract(text)
-        tags = _entities_to_tags(entities)
+        Like ``ingest_directory``, but files are read and run through the
+        pure-Python extractors in ``workers`` processes (default: one per
+        CPU), so extraction is not serialized by the GIL. The worker
+        processes make no bridge calls: documents are created, and
+        embedded when enabled, in the calling process in file order.
+        """
+        files = _matching_files(Path(dir_path), pattern)
+        # Workers get a copy without the embedding backend, which may hold
+        # an API client that cannot be pickled
+        worker_pipeline = replace(self, embed=False, embedding_backend=None)
+        prepare = functools.partial(
+            _prepare_file_in_worker,
+            worker_pipeline,
+            fallback_observed_at=datetime.now(UTC).isoformat(),
+        )
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = self._create_all(pool.map(prepare, files, chunksize=16))
+        if self.embed:
+            self._embed_results(results)
+        return results
 
-        breakdown = self._scorer.score(
-            source="import",
-            precision="day",
-            has_body=bool(text.strip()),
-            has_tags=bool(tags),
+    def _create_all(
+        self, prepared: Iterable[_PreparedDocument]
+    ) -> list[IngestResult]:
+        """Create documents for prepared items in order, in bridge-call batches."""
+        results: list[IngestResult] = []
+        pending: list[_PreparedDocument] = []
+        for item in prepared:
+            pending.append(item)
+            if len(pending) >= CREATE_BATCH_SIZE:
+                results.extend(self._create_batch(pending))
+                pending = []
+        results.extend(self._create_batch(pending))
+        return results
+
+    def _create_batch(self, batch: list[_PreparedDocument]) -> list[IngestResult]:
+        """Create a batch of documents in one bridge call and index transaction."""
+        if not batch:
+            return []
+        created = mkb.create_documents_batch(
+            self.vault_path,
+            [
+                {
+                    "doc_type": self.doc_type,
+                    "title": p.title,
+                    "observed_at": p.observed_at,
+                    "body": p.body,
+                    "tags": p.tags if p.tags else None,
+                }
+                for p in batch
+            ],
         )
+        return [
+            IngestResult(
+                doc_id=doc["id"],
+                title=p.title,
+                observed_at=p.observed_at,
+                confidence=p.confidence,
+                extracted_dates=p.extracted_dates,
+                extracted_entities=p.extracted_entities,
+            )
+            for p, doc in zip(batch, created, strict=True)
+        ]
+
+    def _embed_results(self, results: list[IngestResult]) -> None:
+        """Embed the documents of ingest results in backend-sized batches."""
+        gen = self._generator()
+        for start in range(0, len(results), self.embed_batch_size):
+            batch = results[start : start + self.embed_batch_size]
+            gen.embed_documents_batch([result.doc_id for result in batch])
+            for result in batch:
+                result.embedded = True
+
+    def _generator(self) -> EmbeddingGenerator:
+        """Return the pipeline's embedding generator, creating it on first use."""
+        if self._embedding_generator is None:
+            # Deferred so ingesting without embeddings never loads the generator
+            from mkb_ai.embeddings.generator import EmbeddingGenerator
+
+            self._embedding_generator = EmbeddingGenerator(
+                self.vault_path, self.embedding_backend
+            )
+        return self._embedding_generator
+
+    def dry_run(
+        self,
+        text: str,
+        title: str | None = None,
+        *,
+        include: Iterable[str] = DRY_RUN_SECTIONS,
+    ) -> dict[str, object]:
+        """Preview what would be extracted without creating a document.
+
+        ``include`` names the sections of ``DRY_RUN_SECTIONS`` to compute
+        and return. Entity extraction is skipped unless entities, tags or
+        confidence are requested.
+        """
+        sections = set(include)
+        unknown = sections.difference(DRY_RUN_SECTIONS)
+        if unknown:
+            raise ValueError(f"Unknown dry run sections: {', '.join(sorted(unknown))}")
+
+        preview: dict[str, object] = {}
+        if "title" in sections:
+            preview["title"] = _extract_title(text) if title is None else title
 
-        return {
-            "title": title,
-            "dates": [
+        if "dates" in sections:
+            preview["dates"] = [
                 {"value": d.value.isoformat(), "text": d.original_text, "relative": d.is_relative}
-                for d in dates
-            ],
-            "entities": [
+                for d in self._dates(text)
+            ]
+
+        if sections.isdisjoint(("entities", "tags", "confidence")):
+            return preview
+
+        entities = self._entities(text)
+        tags = _entities_to_tags(entities) if entities else []
+        if "entities" in sections:
+            preview["entities"] = [
                 {"kind": e.kind, "value": e.value}
                 for e in entities
-            ],
-            "tags": tags,
-            "confidence": breakdown.final_score,
-        }
+            ]
+        if "tags" in sections:
+            preview["tags"] = tags
+        if "confidence" in sections:
+            preview["confidence"] = self._scorer.score_fast(
+                source="import",
+                precision="day",
+                has_body=_has_content(text),
+                has_tags=bool(entities),
+            )
+        return preview
+
+
+def _prepare_file_in_worker(
+    pipeline: IngestPipeline, path: Path, fallback_observed_at: str | None
+) -> _PreparedDocument:
+    """Process-pool entry point for ``IngestPipeline.ingest_directory_parallel``."""
+    return pipeline._prepare_file(path, fallback_observed_at)
+
+
+def _matching_files(directory: Path, pattern: str) -> list[Path]:
+    """List files in a directory matching a glob pattern, sorted by name.
+
+    Flat patterns are matched against one ``os.scandir`` pass, whose
+    entries carry their file type, instead of building a Path per entry.
+    Patterns that descend into subdirectories go through ``Path.glob``.
+    """
+    if "/" in pattern or "**" in pattern:
+        return sorted(p for p in directory.glob(pattern) if p.is_file())
+    with os.scandir(directory) as entries:
+        names = [
+            entry.name
+            for entry in entries
+            if fnmatch.fnmatch(entry.name, pattern) and entry.is_file()
+        ]
+    return [directory / name for name in sorted(names)]
 
 
 def _extract_title(text: str) -> str:
-    """Extract title from first markdown heading or first line."""
-    for line in text.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("# "):
-            return stripped[2:].strip()
+    """Extract title from first markdown heading or first line.
+
+    A heading anywhere in the text wins over the first non-empty line.
+    Both are found with a C-level regex search, which stops at the match
+    instead of splitting the whole text into lines.
+    """
+    heading = _HEADING_RE.search(text)
+    if heading:
+        return heading.group(1).strip()
     # Fall back to first non-empty line
-    for line in text.splitlines():
-        if line.strip():
-            return line.strip()[:80]
-    return "Untitled"
-
-
-def _entities_to_tags(entities: list[ExtractedEntity]) -> list[str]:
-    """Convert extracted entities to tags."""
-    tags: list[str] = []
-    seen: set[str] = set()
-    for entity in entities:
-        tag = f"{entity.kind}:{entity.value}"
-        if tag not in seen:
-            tags.append(tag)
-            seen.add(tag)
-    return tags
+    first_line = _FIRST_TEXT_RE.search(text)
+    return first_line.group(0).rstrip()[:80] if first_line else "Untitled"
+
+
+def _has_content(text: str) -> bool:
+    """True if text has a non-whitespace character, without copying it."""
+    return bool(text) and not text.isspace()
+
+
+def _entities_to_tags(entities: Iterable[ExtractedEntity]) -> list[str]:
+    """Convert extracted entities to tags, deduplicated in first-seen order."""
+    return list(dict.fromkeys(f"{entity.kind}:{entity.value}" for entity in entities))
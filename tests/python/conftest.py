@@ -0,0 +1,30 @@
+"""Shared pytest configuration for the Python test suite."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Keep test vaults and temp files on tmpfs when it is available, so file
+# I/O stays in memory. An explicit TMPDIR is left alone.
+if "TMPDIR" not in os.environ and os.access("/dev/shm", os.W_OK):
+    os.environ["TMPDIR"] = "/dev/shm"
+    tempfile.tempdir = None  # re-read TMPDIR on next use
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _in_memory_index_journal() -> Iterator[None]:
+    """Open test vault indexes with an in-memory journal and no fsync.
+
+    Test indexes are throwaway. The variable is set only while the suite
+    runs; tests of the production WAL mode remove it with monkeypatch.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("MKB_TEST_IN_MEMORY", os.environ.get("MKB_TEST_IN_MEMORY", "1"))
+        yield
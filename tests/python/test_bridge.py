@@ -8,12 +8,17 @@ from __future__ import annotations
 
 import hashlib
 import json
+import sqlite3
 import struct
 import tempfile
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import mkb
 
+if TYPE_CHECKING:
+    import pytest
+
 # === T-400.1: Vault CRUD ===
 
 
@@ -53,6 +58,60 @@ class TestVaultCRUD:
             assert doc["body"] == "Project body content"
             assert doc["tags"] == ["rust", "test"]
 
+    def test_create_documents_batch(self) -> None:
+        with tempfile.TemporaryDirectory() as d:
+            mkb.init_vault(d)
+            docs = mkb.create_documents_batch(
+                d,
+                [
+                    {
+                        "doc_type": "project",
+                        "title": "Batch One",
+                        "observed_at": "2025-02-10T00:00:00Z",
+                    },
+                    {
+                        "doc_type": "project",
+                        "title": "Batch One",
+                        "observed_at": "2025-02-11T00:00:00Z",
+                        "body": "Second body",
+                        "tags": ["batch"],
+                    },
+                ],
+            )
+            assert len(docs) == 2
+            assert docs[0]["id"] != docs[1]["id"]
+            assert docs[1]["body"] == "Second body"
+            assert docs[1]["tags"] == ["batch"]
+            assert mkb.document_count(d) == 2
+
+    def test_create_documents_batch_indexes_rows_before_failure(self) -> None:
+        with tempfile.TemporaryDirectory() as d:
+            mkb.init_vault(d)
+            try:
+                mkb.create_documents_batch(
+                    d,
+                    [
+                        {
+                            "doc_type": "project",
+                            "title": "Written",
+                            "observed_at": "2025-02-10T00:00:00Z",
+                        },
+                        {
+                            "doc_type": "project",
+                            "title": "Rejected",
+                            "observed_at": "not-a-date",
+                        },
+                    ],
+                )
+                msg = "Should have raised ValueError"
+                raise AssertionError(msg)
+            except ValueError:
+                pass
+            status = mkb.vault_status(d)
+            assert status["vault_files"] == 1
+            assert status["indexed_documents"] == 1
+            assert status["index_synced"] is True
+
     def test_read_document(self) -> None:
         with tempfile.TemporaryDirectory() as d:
             mkb.init_vault(d)
@@ -149,6 +208,19 @@ class TestIndexOperations:
             )
             assert mkb.document_count(d) == 1
 
+    def test_index_uses_wal_journal(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("MKB_TEST_IN_MEMORY", raising=False)
+        with tempfile.TemporaryDirectory() as d:
+            mkb.init_vault(d)
+            mkb.create_document(d, "project", "WAL", "2025-02-10T00:00:00Z")
+            # WAL mode is stored in the database file, unlike MEMORY
+            conn = sqlite3.connect(Path(d) / ".mkb" / "index" / "mkb.db")
+            try:
+                (mode,) = conn.execute("PRAGMA journal_mode").fetchone()
+            finally:
+                conn.close()
+            assert mode == "wal"
+
 
 # === T-400.3: Temporal Gate ===
 
@@ -232,6 +304,7 @@ class TestEmbeddings:
 
     def test_embedding_dim(self) -> None:
         assert mkb.embedding_dim() == 1536
+        assert mkb.embedding_dim() == mkb.EMBEDDING_DIM
 
     def test_store_and_check_embedding(self) -> None:
         with tempfile.TemporaryDirectory() as d:
@@ -248,6 +321,39 @@ class TestEmbeddings:
 
             assert mkb.has_embedding(d, doc_id)
             assert mkb.embedding_count(d) == 1
+            assert mkb.embedded_doc_ids(d) == {doc_id}
+
+    def test_store_embeddings_batch(self) -> None:
+        with tempfile.TemporaryDirectory() as d:
+            mkb.init_vault(d)
+            ids = [
+                mkb.create_document(d, "project", name, "2025-02-10T00:00:00Z")["id"]
+                for name in ["Alpha", "Beta"]
+            ]
+
+            mkb.store_embeddings_batch(
+                d, [(i, _test_embedding(i)) for i in ids], "test-model"
+            )
+
+            assert all(mkb.has_embedding(d, i) for i in ids)
+            assert mkb.embedding_count(d) == 2
+
+    def test_unembedded_documents(self) -> None:
+        with tempfile.TemporaryDirectory() as d:
+            mkb.init_vault(d)
+            alpha = mkb.create_document(
+                d, "project", "Alpha", "2025-02-10T00:00:00Z",
+                body="Alpha body", tags=["rust", "ml, data"],
+            )
+            beta = mkb.create_document(d, "project", "Beta", "2025-02-10T00:00:00Z")
+            mkb.store_embedding(d, beta["id"], _test_embedding("beta"), "test-model")
+
+            pending = mkb.unembedded_documents(d)
+            assert pending == [("project", alpha["id"])]
+            docs = mkb.read_documents(d, pending)
+            assert docs == [mkb.read_document(d, "project", alpha["id"])]
+            assert docs[0]["body"] == "Alpha body"
+            assert docs[0]["tags"] == ["rust", "ml, data"]
 
     def test_semantic_search(self) -> None:
         with tempfile.TemporaryDirectory() as d:
@@ -280,3 +386,26 @@ class TestEmbeddings:
                 raise AssertionError(msg)
             except ValueError:
                 pass
+
+
+# === Entity Extraction ===
+
+
+class TestEntityScan:
+    """Native entity pattern scanning."""
+
+    def test_entity_scan_reports_char_offsets(self) -> None:
+        text = "Zoë asked @bob about PROJ-12"
+        matches = sorted(mkb.entity_scan(text), key=lambda m: m[3])
+        assert [text[m[1]:m[2]] for m in matches] == ["bob", "PROJ-12"]
+        assert [m[0] for m in matches] == [1, 0]
+
+    def test_entity_scan_selects_patterns(self) -> None:
+        text = "mail alice@example.com"
+        assert [m[0] for m in mkb.entity_scan(text, [4])] == [4]
+        try:
+            mkb.entity_scan(text, [5])
+            msg = "Should have raised ValueError"
+            raise AssertionError(msg)
+        except ValueError:
+            pass
@@ -6,7 +6,6 @@ fallback to now(), and custom column mapping.
 
 from __future__ import annotations
 
-import csv
 import tempfile
 
 import mkb
@@ -189,11 +188,17 @@ class TestCsvCustomMapping:
 
 
 def _write_csv(headers: list[str], rows: list[list[str]]) -> str:
-    """Write a CSV file to a temp path and return the path."""
+    """Write a CSV file to a temp path in one write and return the path."""
+    lines = [",".join(_csv_field(v) for v in row) for row in [headers, *rows]]
     with tempfile.NamedTemporaryFile(
         mode="w", suffix=".csv", delete=False, newline=""
     ) as f:
-        writer = csv.writer(f)
-        writer.writerow(headers)
-        writer.writerows(rows)
+        f.write("\r\n".join(lines) + "\r\n")
         return f.name
+
+
+def _csv_field(value: str) -> str:
+    """Quote a field per RFC 4180, only when it needs quoting."""
+    if any(c in value for c in ',"\r\n'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
@@ -5,26 +5,55 @@ Validates T-410.1 through T-410.4 using mock embeddings (no API calls).
 
 from __future__ import annotations
 
+import shutil
 import tempfile
+from typing import TYPE_CHECKING
 
 import mkb
-from mkb_ai.embeddings import EmbeddingGenerator, embed_document, embed_query
+import numpy as np
+import pytest
+from mkb_ai.embeddings import (
+    EmbeddingGenerator,
+    clear_query_cache,
+    embed_document,
+    embed_query,
+)
 from mkb_ai.embeddings.generator import MockEmbeddingBackend
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 def _setup_vault() -> tuple[str, list[str]]:
     """Create a vault with 3 documents, return (path, doc_ids)."""
     d = tempfile.mkdtemp()
     mkb.init_vault(d)
-    ids = []
-    for name, body in [
-        ("ML Pipeline", "Machine learning model training with PyTorch"),
-        ("Web Server", "HTTP API server built with Rust and Actix"),
-        ("Data Analysis", "Statistical analysis of neural network performance"),
-    ]:
-        doc = mkb.create_document(d, "project", name, "2025-02-10T00:00:00Z", body=body)
-        ids.append(doc["id"])
-    return d, ids
+    docs = mkb.create_documents_batch(
+        d,
+        [
+            {
+                "doc_type": "project",
+                "title": name,
+                "observed_at": "2025-02-10T00:00:00Z",
+                "body": body,
+            }
+            for name, body in [
+                ("ML Pipeline", "Machine learning model training with PyTorch"),
+                ("Web Server", "HTTP API server built with Rust and Actix"),
+                ("Data Analysis", "Statistical analysis of neural network performance"),
+            ]
+        ],
+    )
+    return d, [doc["id"] for doc in docs]
+
+
+@pytest.fixture(scope="module")
+def embedded_vault() -> Iterator[tuple[str, list[str]]]:
+    """Vault from _setup_vault with all documents embedded, for read-only tests."""
+    d, ids = _setup_vault()
+    EmbeddingGenerator(d).embed_all()
+    yield d, ids
+    shutil.rmtree(d, ignore_errors=True)
 
 
 # === T-410.1: Embedding generation ===
@@ -36,7 +65,7 @@ class TestEmbeddingGeneration:
     def test_mock_generates_correct_dimensions(self) -> None:
         backend = MockEmbeddingBackend()
         emb = backend.generate("test text")
-        assert len(emb) == mkb.embedding_dim()
+        assert len(emb) == mkb.EMBEDDING_DIM
         assert len(emb) == 1536
 
     def test_mock_is_deterministic(self) -> None:
@@ -54,9 +83,22 @@ class TestEmbeddingGeneration:
     def test_mock_embeddings_are_normalized(self) -> None:
         backend = MockEmbeddingBackend()
         emb = backend.generate("normalize test")
-        norm = sum(v * v for v in emb) ** 0.5
+        norm = float(np.linalg.norm(np.asarray(emb, dtype=np.float32)))
         assert abs(norm - 1.0) < 0.01
 
+    def test_mock_matches_rust_mock_embedding(self) -> None:
+        # Same pinned values as mock_embedding_matches_python_mock in mkb-index
+        emb = MockEmbeddingBackend().generate("mkb mock parity")
+        expected = {21: 0.24984069, 113: -0.16212885, 271: 0.20849362, 661: -0.24984069}
+        for i, value in expected.items():
+            assert emb[i] == pytest.approx(value, abs=1e-6)
+
+    def test_mock_batch_matches_single(self) -> None:
+        backend = MockEmbeddingBackend()
+        texts = ["first text", "second text"]
+        batch = backend.generate_batch(texts)
+        assert batch == [backend.generate(t) for t in texts]
+
     def test_model_name(self) -> None:
         backend = MockEmbeddingBackend()
         assert backend.model_name == "mock-embedding"
@@ -90,6 +132,22 @@ class TestEmbeddingStorage:
         count = gen.embed_all()
         assert count == 2  # Only 2 new, not 3
 
+    def test_embed_all_with_workers(self) -> None:
+        d, ids = _setup_vault()
+        gen = EmbeddingGenerator(d)
+        count = gen.embed_all(workers=2)
+        assert count == 3
+        for doc_id in ids:
+            assert mkb.has_embedding(d, doc_id)
+
+    async def test_aembed_all_documents(self) -> None:
+        d, ids = _setup_vault()
+        gen = EmbeddingGenerator(d)
+        count = await gen.aembed_all()
+        assert count == 3
+        for doc_id in ids:
+            assert mkb.has_embedding(d, doc_id)
+
 
 # === T-410.3: Semantic search with sqlite-vec ===
 
@@ -97,28 +155,31 @@ class TestEmbeddingStorage:
 class TestSemanticSearch:
     """NEAR() style semantic search returns relevant documents."""
 
-    def test_search_finds_relevant_docs(self) -> None:
-        d, ids = _setup_vault()
+    def test_search_finds_relevant_docs(
+        self, embedded_vault: tuple[str, list[str]]
+    ) -> None:
+        d, ids = embedded_vault
         gen = EmbeddingGenerator(d)
-        gen.embed_all()
 
         # Search for ML-related content — should return ML Pipeline first
         results = gen.search("machine learning model training")
         assert len(results) >= 1
         assert results[0]["id"] == ids[0]  # ML Pipeline
 
-    def test_search_respects_limit(self) -> None:
-        d, _ids = _setup_vault()
+    def test_search_respects_limit(
+        self, embedded_vault: tuple[str, list[str]]
+    ) -> None:
+        d, _ids = embedded_vault
         gen = EmbeddingGenerator(d)
-        gen.embed_all()
 
         results = gen.search("project", limit=2)
         assert len(results) == 2
 
-    def test_search_returns_distance_scores(self) -> None:
-        d, _ids = _setup_vault()
+    def test_search_returns_distance_scores(
+        self, embedded_vault: tuple[str, list[str]]
+    ) -> None:
+        d, _ids = embedded_vault
         gen = EmbeddingGenerator(d)
-        gen.embed_all()
 
         results = gen.search("data analysis statistics")
         assert len(results) >= 1
@@ -141,4 +202,52 @@ class TestConvenienceFunctions:
 
     def test_embed_query_function(self) -> None:
         emb = embed_query("test query")
-        assert len(emb) == mkb.embedding_dim()
+        assert len(emb) == mkb.EMBEDDING_DIM
+
+    def test_embed_query_returns_fresh_list_from_cache(self) -> None:
+        first = embed_query("cached query")
+        first[0] = 42.0
+        assert embed_query("cached query") == MockEmbeddingBackend().generate("cached query")
+
+    def test_embed_query_cache_is_shared_across_backend_instances(self) -> None:
+        calls: list[str] = []
+
+        class CountingBackend(MockEmbeddingBackend):
+            def generate(self, text: str) -> list[float]:
+                calls.append(text)
+                return super().generate(text)
+
+        embed_query("shared query", CountingBackend())
+        embed_query("shared query", CountingBackend())
+        assert calls == ["shared query"]
+
+    def test_embed_query_skips_cache_without_cache_key(self) -> None:
+        calls: list[str] = []
+
+        class UnkeyedBackend:
+            model_name = "mock-embedding"
+            dimensions = mkb.EMBEDDING_DIM
+
+            def generate(self, text: str) -> list[float]:
+                calls.append(text)
+                return MockEmbeddingBackend().generate(text)
+
+            def generate_batch(self, texts: list[str]) -> list[list[float]]:
+                return [self.generate(t) for t in texts]
+
+        embed_query("unkeyed query", UnkeyedBackend())
+        embed_query("unkeyed query", UnkeyedBackend())
+        assert calls == ["unkeyed query", "unkeyed query"]
+
+    def test_clear_query_cache(self) -> None:
+        calls: list[str] = []
+
+        class CountingBackend(MockEmbeddingBackend):
+            def generate(self, text: str) -> list[float]:
+                calls.append(text)
+                return super().generate(text)
+
+        embed_query("cleared query", CountingBackend())
+        clear_query_cache()
+        embed_query("cleared query", CountingBackend())
+        assert calls == ["cleared query", "cleared query"]
@@ -5,10 +5,18 @@ Validates T-420.1 (dates), T-420.2 (entities), T-420.3 (confidence).
 
 from __future__ import annotations
 
+import functools
+import re
 from datetime import UTC, datetime
 
+import pytest
 from mkb_ai.confidence import ConfidenceScorer, score_document
-from mkb_ai.extraction import DateExtractor, EntityExtractor
+from mkb_ai.extraction import DateExtractor, EntityExtractor, entities
+
+# Shared by tests that need no reference_time or custom weights
+_DATES = DateExtractor()
+_ENTITIES = EntityExtractor()
+_SCORER = ConfidenceScorer()
 
 # === T-420.1: Date/time extraction ===
 
@@ -17,7 +25,7 @@ class TestDateExtraction:
     """Extract dates from unstructured text."""
 
     def test_extract_iso_datetime(self) -> None:
-        ext = DateExtractor()
+        ext = _DATES
         results = ext.extract("Meeting was on 2025-02-10T14:30:00Z.")
         assert len(results) == 1
         assert results[0].value.year == 2025
@@ -25,20 +33,31 @@ class TestDateExtraction:
         assert results[0].value.day == 10
 
     def test_extract_iso_date(self) -> None:
-        ext = DateExtractor()
+        ext = _DATES
         results = ext.extract("Deadline is 2025-06-15.")
         assert len(results) == 1
         assert results[0].value.day == 15
 
+    def test_extract_date_of_invalid_iso_datetime(self) -> None:
+        ext = _DATES
+        results = ext.extract("at 2025-02-10 24:00:00 UTC")
+        assert [r.original_text for r in results] == ["2025-02-10"]
+        assert (results[0].start, results[0].end) == (3, 13)
+        assert ext.extract("at 2025-02-10T24:00:00 UTC") == []
+
+    def test_extract_date_inside_invalid_written_date(self) -> None:
+        results = _DATES.extract("Feb 30, 2025-02-10")
+        assert [r.original_text for r in results] == ["2025-02-10"]
+
     def test_extract_written_date(self) -> None:
-        ext = DateExtractor()
+        ext = _DATES
         results = ext.extract("Started on January 15, 2025.")
         assert len(results) == 1
         assert results[0].value.month == 1
         assert results[0].value.day == 15
 
     def test_extract_slash_date(self) -> None:
-        ext = DateExtractor()
+        ext = _DATES
         results = ext.extract("Due by 3/15/2025.")
         assert len(results) == 1
         assert results[0].value.month == 3
@@ -58,8 +77,15 @@ class TestDateExtraction:
         assert len(results) == 1
         assert results[0].value.day == 5
 
+    def test_extract_relative_is_case_insensitive(self) -> None:
+        ref = datetime(2025, 2, 10, tzinfo=UTC)
+        ext = DateExtractor(reference_time=ref)
+        results = ext.extract("Shipped TODAY, reviewed Last Week.")
+        assert len(results) == 2
+        assert all(r.is_relative for r in results)
+
     def test_extract_multiple_dates(self) -> None:
-        ext = DateExtractor()
+        ext = _DATES
         text = "Started 2025-01-01 and finishes 2025-12-31."
         results = ext.extract(text)
         assert len(results) == 2
@@ -68,19 +94,52 @@ class TestDateExtraction:
         assert results[1].value.month == 12
 
     def test_extract_no_dates(self) -> None:
-        ext = DateExtractor()
+        ext = _DATES
         results = ext.extract("No dates here, just text.")
         assert len(results) == 0
 
+    def test_count_matches_extract(self) -> None:
+        ext = DateExtractor(reference_time=datetime(2025, 2, 10, tzinfo=UTC))
+        text = "Due 2025-03-01, moved from 13/45/2025 on 2/1/2025, 3 days ago."
+        assert ext.count(text) == len(ext.extract(text)) == 3
+        assert ext.count("No dates here, just text.") == 0
+
 
 # === T-420.2: Entity extraction ===
 
+# Mixed ASCII and non-ASCII text covering every entity kind and an overlap
+_ENTITY_CORPUS = [
+    "Zoë asked @jose about PROJ-12 and TEAM-7 before lunch.",
+    "Ana Smith (CTO) and José Ruiz (PM) met @zoë.b in Zürich.",
+    "Docs at https://exämple.com/ä?x=1) or HTTP://Example.com/path].",
+    "Mail zoë@example.com, jane.doe@example.co.uk or @naïve.",
+    "Plain ASCII text with no entities at all.",
+    "",
+]
+
+
+def _use_fallback_entities(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Force the pure-Python entity scan, compiled with stdlib re.
+
+    Uses ``re`` rather than re2 so ``\\w`` and ``\\b`` are Unicode-aware, as in
+    the Rust regex crate behind the native scan.
+    """
+    monkeypatch.setattr(entities, "_entity_scan", None)
+    monkeypatch.setattr(
+        entities,
+        "_KIND_PATTERNS",
+        tuple(
+            (kind, required, functools.cache(lambda p=pattern: re.compile(p().pattern)), group)
+            for kind, required, pattern, group in entities._KIND_PATTERNS
+        ),
+    )
+
 
 class TestEntityExtraction:
     """Extract entities from unstructured text."""
 
     def test_extract_jira_ticket(self) -> None:
-        ext = EntityExtractor()
+        ext = _ENTITIES
         results = ext.extract("Fixed in PROJ-123 and related to TEAM-456.")
         tickets = [e for e in results if e.kind == "jira_ticket"]
         assert len(tickets) == 2
@@ -88,7 +147,7 @@ class TestEntityExtraction:
         assert tickets[1].value == "TEAM-456"
 
     def test_extract_at_mentions(self) -> None:
-        ext = EntityExtractor()
+        ext = _ENTITIES
         results = ext.extract("Assigned to @jane.smith and reviewed by @john.")
         people = [e for e in results if e.kind == "person"]
         assert len(people) == 2
@@ -96,35 +155,57 @@ class TestEntityExtraction:
         assert people[1].value == "john"
 
     def test_extract_person_with_title(self) -> None:
-        ext = EntityExtractor()
+        ext = _ENTITIES
         results = ext.extract("Approved by Jane Smith (VP).")
         people = [e for e in results if e.kind == "person"]
         assert len(people) == 1
         assert people[0].value == "Jane Smith"
 
     def test_extract_urls(self) -> None:
-        ext = EntityExtractor()
+        ext = _ENTITIES
         results = ext.extract("See https://example.com/docs for details.")
         urls = [e for e in results if e.kind == "url"]
         assert len(urls) == 1
         assert urls[0].value == "https://example.com/docs"
 
     def test_extract_emails(self) -> None:
-        ext = EntityExtractor()
+        ext = _ENTITIES
         results = ext.extract("Contact jane@example.com for questions.")
         emails = [e for e in results if e.kind == "email"]
         assert len(emails) == 1
         assert emails[0].value == "jane@example.com"
 
     def test_extract_by_kind(self) -> None:
-        ext = EntityExtractor()
+        ext = _ENTITIES
         text = "PROJ-123 assigned to @jane with docs at https://example.com"
         tickets = ext.extract_by_kind(text, "jira_ticket")
         assert len(tickets) == 1
         assert tickets[0].value == "PROJ-123"
 
+    def test_extract_keeps_overlapping_kinds(self) -> None:
+        ext = _ENTITIES
+        results = ext.extract("Contact jane@example.com")
+        assert [(e.kind, e.value) for e in results] == [
+            ("email", "jane@example.com"),
+            ("person", "example.com"),
+        ]
+        assert ext.extract_by_kind("Contact jane@example.com", "email") == results[:1]
+
+    def test_native_scan_matches_fallback(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        if entities._entity_scan is None:
+            pytest.skip("bridge has no native entity_scan")
+
+        def scan_all() -> list[list[entities.ExtractedEntity]]:
+            return [_ENTITIES.extract(t) for t in _ENTITY_CORPUS] + [
+                _ENTITIES.extract_by_kind(t, "person") for t in _ENTITY_CORPUS
+            ]
+
+        native = scan_all()
+        _use_fallback_entities(monkeypatch)
+        assert scan_all() == native
+
     def test_extract_no_entities(self) -> None:
-        ext = EntityExtractor()
+        ext = _ENTITIES
         results = ext.extract("Just plain text with no special entities.")
         # Filter out false positives from title-case words
         meaningful = [e for e in results if e.kind in ("jira_ticket", "url", "email")]
@@ -138,7 +219,7 @@ class TestConfidenceScoring:
     """Confidence scoring based on source, precision, completeness."""
 
     def test_human_authored_high_confidence(self) -> None:
-        scorer = ConfidenceScorer()
+        scorer = _SCORER
         result = scorer.score(
             source="human",
             precision="exact",
@@ -150,7 +231,7 @@ class TestConfidenceScoring:
         assert result.final_score >= 0.9
 
     def test_ai_generated_lower_confidence(self) -> None:
-        scorer = ConfidenceScorer()
+        scorer = _SCORER
         result = scorer.score(
             source="ai",
             precision="approximate",
@@ -161,7 +242,7 @@ class TestConfidenceScoring:
         assert result.final_score < 0.7
 
     def test_corroboration_boosts_score(self) -> None:
-        scorer = ConfidenceScorer()
+        scorer = _SCORER
         base = scorer.score(source="manual", precision="day", has_body=True)
         boosted = scorer.score(
             source="manual", precision="day", has_body=True, corroboration_count=3
@@ -170,7 +251,7 @@ class TestConfidenceScoring:
         assert boosted.corroboration_bonus > 0
 
     def test_score_never_exceeds_one(self) -> None:
-        scorer = ConfidenceScorer()
+        scorer = _SCORER
         result = scorer.score(
             source="human",
             precision="exact",
@@ -193,6 +274,49 @@ class TestConfidenceScoring:
         assert 0.0 < score <= 1.0
 
     def test_unknown_source_gets_default(self) -> None:
-        scorer = ConfidenceScorer()
+        scorer = _SCORER
         result = scorer.score(source="something_new", precision="day")
         assert result.source_score == 0.6  # Default for unknown
+
+    def test_score_many_matches_score(self) -> None:
+        scorer = _SCORER
+        sources = ["human", "ai", None]
+        precisions = ["exact", "approximate", "day"]
+        has_body = [True, True, False]
+        counts = [5, 0, 2]
+        scores = scorer.score_many(
+            sources, precisions, has_body=has_body, corroboration_counts=counts
+        )
+        expected = [
+            scorer.score(
+                source=s, precision=p, has_body=b, corroboration_count=c
+            ).final_score
+            for s, p, b, c in zip(sources, precisions, has_body, counts, strict=True)
+        ]
+        assert scores.tolist() == expected
+
+    def test_score_many_rejects_misaligned_columns(self) -> None:
+        with pytest.raises(ValueError, match="has_body has 1 values for 2 sources"):
+            _SCORER.score_many(["human", "ai"], has_body=[True])
+        with pytest.raises(ValueError, match="corroboration_counts has 3 values"):
+            _SCORER.score_many(["human", "ai"], corroboration_counts=[1, 2, 3])
+
+    def test_score_fast_matches_score(self) -> None:
+        scorer = _SCORER
+        for kwargs in [
+            {},
+            {"source": "human", "precision": "exact", "has_body": True},
+            {"source": "AI", "has_tags": True, "has_links": True},
+            {"precision": "quarter", "has_observed_at": False},
+            {"source": "import", "corroboration_count": 7},
+        ]:
+            assert scorer.score_fast(**kwargs) == scorer.score(**kwargs).final_score
+
+    def test_weights_can_be_adjusted_after_construction(self) -> None:
+        scorer = ConfidenceScorer()
+        scorer.corroboration_weight = 0.0
+        expected = ConfidenceScorer(corroboration_weight=0.0)
+        assert scorer.score(corroboration_count=5) == expected.score(corroboration_count=5)
+        assert scorer.score_fast(corroboration_count=5) == expected.score_fast(
+            corroboration_count=5
+        )
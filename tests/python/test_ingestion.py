@@ -5,12 +5,18 @@ Validates T-420.4: ingest with AI enrichment, directory batch, dry run.
 
 from __future__ import annotations
 
+import subprocess
+import sys
 import tempfile
-from pathlib import Path
+from typing import TYPE_CHECKING
 
 import mkb
+import pytest
 from mkb_ai.ingestion import IngestPipeline
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 def _setup_vault() -> str:
     """Create an empty vault, return path."""
@@ -81,40 +87,109 @@ class TestIngestText:
         assert result.embedded
         assert mkb.has_embedding(d, result.doc_id)
 
+    def test_ingest_reuses_embedding_generator(self) -> None:
+        d = _setup_vault()
+        pipeline = IngestPipeline(vault_path=d, embed=True)
+        pipeline.ingest_text("First note.", observed_at="2025-02-10T00:00:00Z")
+        generator = pipeline._generator()
+        pipeline.ingest_text("Second note.", observed_at="2025-02-11T00:00:00Z")
+        assert pipeline._generator() is generator
+        assert mkb.embedding_count(d) == 2
+
+    def test_pipelines_share_entity_extractor(self) -> None:
+        d = _setup_vault()
+        first = IngestPipeline(vault_path=d)
+        second = IngestPipeline(vault_path=d)
+        assert first._entity_extractor is second._entity_extractor
+        assert first._date_extractor is not second._date_extractor
+
 
 class TestIngestFile:
     """Ingest files from disk."""
 
-    def test_ingest_single_file(self) -> None:
+    def test_ingest_single_file(self, tmp_path: Path) -> None:
         d = _setup_vault()
         pipeline = IngestPipeline(vault_path=d)
 
         # Create a test file
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".md", delete=False
-        ) as f:
-            f.write("# Project Plan\n\nTimeline starts 2025-03-01.\n")
-            file_path = f.name
+        file_path = tmp_path / "plan.md"
+        file_path.write_text("# Project Plan\n\nTimeline starts 2025-03-01.\n")
 
         result = pipeline.ingest_file(file_path)
         assert result.title == "Project Plan"
         assert result.extracted_dates >= 1
 
-    def test_ingest_directory(self) -> None:
+    def test_ingest_directory(self, tmp_path: Path) -> None:
         d = _setup_vault()
         pipeline = IngestPipeline(vault_path=d)
 
-        # Create a temp directory with markdown files
-        with tempfile.TemporaryDirectory() as td:
-            for name in ["alpha.md", "beta.md", "gamma.md"]:
-                Path(td, name).write_text(
-                    f"# {name[:-3].title()}\n\nContent for {name}.\n"
-                )
-            Path(td, "readme.txt").write_text("Not a markdown file.\n")
+        # Fill the temp directory with markdown files
+        for name in ["alpha.md", "beta.md", "gamma.md"]:
+            (tmp_path / name).write_text(f"# {name[:-3].title()}\n\nContent for {name}.\n")
+        (tmp_path / "readme.txt").write_text("Not a markdown file.\n")
+        (tmp_path / "notes.md").mkdir()
 
-            results = pipeline.ingest_directory(td)
-            assert len(results) == 3
-            assert mkb.document_count(d) == 3
+        results = pipeline.ingest_directory(tmp_path)
+        assert len(results) == 3
+        assert mkb.document_count(d) == 3
+
+    def test_ingest_directory_keeps_entity_tags(self, tmp_path: Path) -> None:
+        d = _setup_vault()
+        pipeline = IngestPipeline(vault_path=d)
+
+        (tmp_path / "alpha.md").write_text("# Alpha\n\nTracked in PROJ-12.\n")
+        (tmp_path / "beta.md").write_text("# Beta\n\nNo entities.\n")
+
+        alpha, beta = pipeline.ingest_directory(tmp_path)
+        alpha_doc = mkb.read_document(d, "document", alpha.doc_id)
+        assert alpha_doc["tags"] == ["jira_ticket:PROJ-12"]
+        assert mkb.read_document(d, "document", beta.doc_id)["tags"] == []
+
+    def test_ingest_directory_shares_fallback_timestamp(self, tmp_path: Path) -> None:
+        d = _setup_vault()
+        pipeline = IngestPipeline(vault_path=d)
+
+        for name in ["alpha.md", "beta.md", "gamma.md"]:
+            (tmp_path / name).write_text(f"# {name[:-3].title()}\n\nNo dates.\n")
+
+        results = pipeline.ingest_directory(tmp_path)
+        assert len({r.observed_at for r in results}) == 1
+
+    def test_ingest_directory_with_workers(self, tmp_path: Path) -> None:
+        d = _setup_vault()
+        pipeline = IngestPipeline(vault_path=d)
+
+        names = ["alpha.md", "beta.md", "gamma.md", "delta.md"]
+        for name in names:
+            (tmp_path / name).write_text(f"# {name[:-3].title()}\n\nContent.\n")
+
+        results = pipeline.ingest_directory(tmp_path, workers=3)
+        assert [r.title for r in results] == [n[:-3].title() for n in sorted(names)]
+        assert mkb.document_count(d) == 4
+
+    def test_ingest_directory_parallel(self, tmp_path: Path) -> None:
+        d = _setup_vault()
+        pipeline = IngestPipeline(vault_path=d)
+
+        names = ["alpha.md", "beta.md", "gamma.md", "delta.md"]
+        for name in names:
+            (tmp_path / name).write_text(f"# {name[:-3].title()}\n\nDue 2025-03-01.\n")
+
+        results = pipeline.ingest_directory_parallel(tmp_path, workers=2)
+        assert [r.title for r in results] == [n[:-3].title() for n in sorted(names)]
+        assert all(r.extracted_dates == 1 for r in results)
+        assert mkb.document_count(d) == 4
+
+    def test_ingest_directory_embeds_in_batches(self, tmp_path: Path) -> None:
+        d = _setup_vault()
+        pipeline = IngestPipeline(vault_path=d, embed=True, embed_batch_size=2)
+
+        for name in ["alpha.md", "beta.md", "gamma.md"]:
+            (tmp_path / name).write_text(f"# {name[:-3].title()}\n\nContent.\n")
+
+        results = pipeline.ingest_directory(tmp_path)
+        assert all(r.embedded for r in results)
+        assert mkb.embedding_count(d) == 3
 
 
 class TestDryRun:
@@ -142,3 +217,45 @@ class TestDryRun:
         tags = preview["tags"]
         assert isinstance(tags, list)
         assert len(tags) >= 2
+
+    def test_dry_run_prefers_heading_over_first_line(self) -> None:
+        pipeline = IngestPipeline(vault_path=_setup_vault())
+        preview = pipeline.dry_run("Intro line\n\n# Real Title\n\nBody.")
+        assert preview["title"] == "Real Title"
+
+    def test_dry_run_include_selects_sections(self) -> None:
+        pipeline = IngestPipeline(vault_path=_setup_vault())
+        preview = pipeline.dry_run(
+            "Meeting with @alice on 2025-04-01.", include=("title", "dates")
+        )
+        assert list(preview) == ["title", "dates"]
+        assert len(preview["dates"]) == 1  # type: ignore[arg-type]
+
+    def test_ingest_after_dry_run_reuses_extraction(self) -> None:
+        d = _setup_vault()
+        pipeline = IngestPipeline(vault_path=d)
+        text = "Meeting with @alice about PROJ-456 on 2025-04-01."
+        preview = pipeline.dry_run(text)
+        dates, entities = pipeline._dates(text), pipeline._entities(text)
+        result = pipeline.ingest_text(text)
+        assert pipeline._dates(text) is dates
+        assert pipeline._entities(text) is entities
+        assert result.extracted_entities == len(preview["entities"])  # type: ignore[arg-type]
+
+    def test_dry_run_does_not_load_numpy(self) -> None:
+        # In a fresh interpreter, so modules imported by other tests don't count
+        script = (
+            "import sys, mkb; before = 'numpy' in sys.modules; "
+            "from mkb_ai.ingestion import IngestPipeline; "
+            "IngestPipeline(vault_path='.').dry_run('Met @bob on 2025-04-01.'); "
+            "print(before or 'numpy' not in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "True"
+
+    def test_dry_run_rejects_unknown_section(self) -> None:
+        pipeline = IngestPipeline(vault_path=_setup_vault())
+        with pytest.raises(ValueError, match="summary"):
+            pipeline.dry_run("Some text.", include=("dates", "summary"))